@@ -0,0 +1,285 @@
+"""Typed model of api.json, shared by the generators.
+
+api.json is turned once into frozen dataclasses (types, fields, methods
+and the subtype hierarchies), which are cached in a pickle next to it.
+The cache is reused while api.json keeps its mtime and size, or its
+content hash when only the mtime changed, and this module is unchanged.
+"""
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import re
+from typing import Optional
+
+
+SCALARS = {
+    "String": "str",
+    "Boolean": "bool",
+    "Integer": "int",
+    "Float": "float"
+}
+CACHE = ".api_ir.pickle"
+# Suffix of the description of a field whose value is fixed by the subtype,
+# e.g. 'The member's status in the chat, always "creator"'
+DISCRIMINATOR = re.compile(r", (?:always|must be) \"?(\w+)\"?$")
+
+
+def camel_to_snake(name):
+    # https://stackoverflow.com/q/1175208
+    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+@dataclasses.dataclass(frozen=True)
+class TypeRef:
+    """A type as written in the docs, e.g. ``Array of Array of PhotoSize``."""
+
+    name: str
+    depth: int = 0
+
+    @property
+    def scalar(self) -> Optional[str]:
+        # Python type of String, Integer, ... None for API types
+        return SCALARS.get(self.name)
+
+    @property
+    def item(self) -> "TypeRef":
+        # Array of Array of X --> Array of X
+        return TypeRef(self.name, self.depth - 1)
+
+    def __str__(self) -> str:
+        return "Array of " * self.depth + self.name
+
+    @classmethod
+    def parse(cls, text: str) -> "TypeRef":
+        return cls(text.split("Array of ")[-1], text.count("Array of "))
+
+
+@dataclasses.dataclass(frozen=True)
+class Field:
+    name: str
+    types: tuple[TypeRef, ...]
+    required: bool
+    description: str
+
+    @property
+    def attribute(self) -> str:
+        # from is a keyword, it's stored as from_user
+        return "from_user" if self.name == "from" else self.name
+
+
+@dataclasses.dataclass(frozen=True)
+class Hierarchy:
+    """How a base class is split into its subtypes."""
+
+    # Fields shared by every subtype, declared by the base class
+    fields: tuple[Field, ...]
+    # Field whose value tells the subtypes apart, if any
+    discriminator: Optional[str]
+    # Subtype -> {field: value fixed by the subtype}
+    constants: dict
+    # (value, key, subtype) entries of the dispatch table
+    variants: tuple[tuple, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class Type:
+    name: str
+    file_name: str
+    description: tuple[str, ...]
+    fields: tuple[Field, ...]
+    subtypes: tuple[str, ...]
+    subtype_of: tuple[str, ...]
+    # Hash of the api.json entry, for incremental builds
+    digest: str
+    hierarchy: Optional[Hierarchy] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class Method:
+    name: str
+    description: tuple[str, ...]
+    fields: tuple[Field, ...]
+    returns: tuple[TypeRef, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class Api:
+    types: dict
+    methods: dict
+
+
+def build_refs(tree: dict, depth: int = 0) -> tuple[TypeRef, ...]:
+    if tree["kind"] == "array":
+        return build_refs(tree["element"], depth + 1)
+
+    if tree["kind"] == "union":
+        # Array of (A or B) is parsed as Array of A or Array of B
+        return tuple(y for x in tree["members"] for y in build_refs(x, depth))
+
+    return (TypeRef(tree["name"], depth),)
+
+
+def build_field(data: dict) -> Field:
+    if "type" in data:
+        types = build_refs(data["type"])
+    else:
+        # api.json from before the type trees
+        types = tuple(map(TypeRef.parse, data["types"]))
+
+    return Field(
+        data["name"],
+        types,
+        data["required"],
+        data["description"]
+    )
+
+
+def build_hierarchy(types: dict, name: str) -> Hierarchy:
+    subtypes = [types[x] for x in types[name].subtypes]
+    fields = []
+    discriminator = None
+    constants = {x.name: {} for x in subtypes}
+
+    # The base class declares the fields shared by every subtype
+    for field in subtypes[0].fields:
+        same = [
+            y
+            for x in subtypes
+            for y in x.fields
+            if y.name == field.name and y.types == field.types
+        ]
+        if len(same) != len(subtypes):
+            continue
+
+        fields.append(Field(
+            field.name,
+            field.types,
+            all(y.required for y in same),
+            min(
+                (DISCRIMINATOR.sub("", y.description) for y in same),
+                key=len
+            )
+        ))
+
+        values = [DISCRIMINATOR.search(y.description) for y in same]
+        if discriminator is None and all(values):
+            discriminator = field.name
+            for x, value in zip(subtypes, values):
+                constants[x.name][discriminator] = value.group(1)
+
+    groups = {}
+    for x in subtypes:
+        value = constants[x.name].get(discriminator)
+        groups.setdefault(value, []).append(x)
+
+    variants = []
+    for value, group in groups.items():
+        required = {
+            x.name: [
+                y.name
+                for y in x.fields
+                if y.required and y.name != discriminator
+            ]
+            for x in group
+        }
+        # Subtypes requiring more fields are tried first, each one keyed
+        # by a required field that none of the next candidates requires
+        names = sorted(required, key=lambda x: -len(required[x]))
+
+        for i, x in enumerate(names):
+            others = {y for z in names[i + 1:] for y in required[z]}
+            key = next((y for y in required[x] if y not in others), None)
+
+            if value is not None and i == len(names) - 1:
+                key = None
+
+            variants.append((value, key, x))
+
+    return Hierarchy(tuple(fields), discriminator, constants, tuple(variants))
+
+
+def build(docs: dict) -> Api:
+    types = {}
+
+    for x in docs["types"].values():
+        types[x["name"]] = Type(
+            x["name"],
+            camel_to_snake(x["name"]),
+            tuple(x["description"]),
+            tuple(map(build_field, x.get("fields", []))),
+            tuple(x.get("subtypes", [])),
+            tuple(x.get("subtype_of", [])),
+            hashlib.sha256(
+                json.dumps(x, sort_keys=True).encode()
+            ).hexdigest()
+        )
+
+    for x in list(types.values()):
+        if x.subtypes:
+            types[x.name] = dataclasses.replace(
+                x,
+                hierarchy=build_hierarchy(types, x.name)
+            )
+
+    methods = {
+        x["name"]: Method(
+            x["name"],
+            tuple(x["description"]),
+            tuple(map(build_field, x.get("fields", []))),
+            tuple(map(TypeRef.parse, x.get("returns", [])))
+        )
+        for x in docs["methods"].values()
+    }
+
+    return Api(types, methods)
+
+
+def source_hash() -> str:
+    # Any change to this module rebuilds the cache, no version to bump
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load(path: str = "api.json", cache: str = CACHE) -> Api:
+    stat = os.stat(path)
+    source = source_hash()
+
+    try:
+        with open(cache, "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+        cached = {}
+
+    if cached.get("source") != source:
+        cached = {}
+
+    if (
+        cached.get("mtime") == stat.st_mtime_ns and
+        cached.get("size") == stat.st_size
+    ):
+        return cached["api"]
+
+    with open(path, "rb") as f:
+        content = f.read()
+
+    digest = hashlib.sha256(content).hexdigest()
+
+    # A touched but unchanged api.json only refreshes the cache key
+    if cached.get("digest") == digest:
+        api = cached["api"]
+    else:
+        api = build(json.loads(content))
+
+    with open(cache, "wb") as f:
+        pickle.dump({
+            "source": source,
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "digest": digest,
+            "api": api
+        }, f, pickle.HIGHEST_PROTOCOL)
+
+    return api
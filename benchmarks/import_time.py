@@ -0,0 +1,59 @@
+"""Measure the cold-start cost of importing the generated types.
+
+Run it with a pybotgram installation using the generated types, once
+for every build to compare:
+
+    python benchmarks/import_time.py [Type ...]
+
+Every run is a fresh interpreter started with ``-X importtime``, which
+imports ``pybotgram.types`` and reads the given types (``Update`` and
+``Message`` by default, what a bot handling messages touches).
+"""
+import argparse
+import subprocess
+import sys
+
+
+def measure(names: list[str]) -> tuple[int, int]:
+    code = "import pybotgram.types as t\n" + "".join(
+        f"t.{x}\n" for x in names
+    )
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stderr
+
+    # import time: self [us] | cumulative | imported package
+    total = count = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:"):].split("|")
+        if fields[2].strip().startswith("pybotgram.types"):
+            total += int(fields[0])
+            count += 1
+
+    return total, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "names",
+        nargs="*",
+        default=["Update", "Message"],
+        help="types read after the import"
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    # The best run is the least disturbed by the rest of the system
+    total, count = min(measure(args.names) for _ in range(args.rounds))
+    print(f"{count} modules of pybotgram.types imported in {total / 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare the unrolled parsers with the table-driven ones.
+
+Run it with a pybotgram installation using the generated types, once
+for a default build and once for a ``--table`` build:
+
+    python benchmarks/parse_backends.py [updates.json]
+
+It reports the time to parse an update of the corpus, the time to import
+every type and the memory the imported modules hold. The import and the
+memory are measured in fresh interpreters.
+"""
+import argparse
+import copy
+import json
+import os
+import subprocess
+import sys
+import time
+
+from pybotgram import types
+
+
+CORPUS = os.path.join(os.path.dirname(__file__), "updates.json")
+# Every type is read, so that every module is imported
+IMPORT = (
+    "import pybotgram.types as t\n"
+    "for x in t.__all__:\n"
+    "    getattr(t, x)\n"
+)
+
+
+def measure_parse(updates: list, rounds: int) -> float:
+    raws = [copy.deepcopy(updates) for _ in range(rounds)]
+
+    start = time.perf_counter()
+    for batch in raws:
+        for update in batch:
+            types.Update._parse(update, None)
+
+    return (time.perf_counter() - start) / (len(updates) * rounds)
+
+
+def measure_import() -> float:
+    code = f"import time\nstart = time.perf_counter()\n{IMPORT}" + (
+        "print(time.perf_counter() - start)"
+    )
+
+    return float(subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout)
+
+
+def measure_memory() -> int:
+    code = f"import tracemalloc\ntracemalloc.start()\n{IMPORT}" + (
+        "print(tracemalloc.get_traced_memory()[0])"
+    )
+
+    return int(subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "corpus",
+        nargs="?",
+        default=CORPUS,
+        help="JSON list of updates"
+    )
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    with open(args.corpus) as f:
+        updates = json.load(f)
+
+    # The best run is the least disturbed by the rest of the system
+    parse = min(measure_parse(updates, 200) for _ in range(args.rounds))
+    imported = min(measure_import() for _ in range(args.rounds))
+    memory = measure_memory()
+
+    print(f"parse: {parse * 1e6:.1f}us per Update")
+    print(f"import: {imported * 1000:.1f}ms for {len(types.__all__)} types")
+    print(f"memory: {memory / 1024:.0f}KiB held by the imported modules")
+
+
+if __name__ == "__main__":
+    main()
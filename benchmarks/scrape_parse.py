@@ -0,0 +1,104 @@
+"""Measure the cost of turning a saved Bot API page into a tree.
+
+Run it from the repository, on a page saved by ``scrape.py``:
+
+    python benchmarks/scrape_parse.py [page.html]
+
+The page defaults to the latest snapshot. The whole page parsed with
+``html.parser`` (what ``scrape`` used to do) is compared with the docs
+alone, parsed at once through a ``SoupStrainer`` or section by section
+as ``scrape`` does, with ``html.parser`` and, when it's installed,
+``lxml``.
+"""
+import argparse
+import functools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bs4 import BeautifulSoup, SoupStrainer  # noqa: E402
+
+import scrape  # noqa: E402
+
+
+def parse_page(text: str, features: str):
+    soup = BeautifulSoup(text, features)
+    return soup.find("div", {"id": "dev_page_content"})
+
+
+def parse_content(text: str, features: str):
+    return BeautifulSoup(
+        text, 
+        features, 
+        parse_only=SoupStrainer("div", id="dev_page_content")
+    )
+
+
+def parse_sections(text: str, features: str):
+    return [
+        scrape.parse_section(x, features) 
+        for x in scrape.get_sections(scrape.get_content(text))
+    ]
+
+
+def measure(parse, text: str, rounds: int) -> tuple[float, int]:
+    best = float("inf")
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parse(text)
+        best = min(best, time.perf_counter() - start)
+
+    # Peak memory is measured apart, tracemalloc slows parsing down
+    tracemalloc.start()
+    parse(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("page", nargs="?", help="saved Bot API page")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    page = args.page
+    if page is None:
+        index = scrape.load_index(scrape.SNAPSHOTS)
+        if index["latest"] is None:
+            parser.error("no snapshot saved yet, give the page to parse")
+        page = os.path.join(scrape.SNAPSHOTS, index["latest"])
+
+    with open(page, encoding="utf-8") as f:
+        text = f.read()
+
+    features = ["html.parser"]
+    if scrape.get_features() == "lxml":
+        features.append("lxml")
+
+    parsers = {
+        "whole page, html.parser": (
+            functools.partial(parse_page, features="html.parser")
+        )
+    }
+
+    for x in features:
+        parsers[f"docs only, {x}"] = (
+            functools.partial(parse_content, features=x)
+        )
+        parsers[f"sections, {x}"] = (
+            functools.partial(parse_sections, features=x)
+        )
+
+    for name, parse in parsers.items():
+        best, peak = measure(parse, text, args.rounds)
+        print(f"{name}: {best * 1000:.1f}ms, {peak / 2 ** 20:.1f}MiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measure the memory held by parsed updates.
+
+Run it with a pybotgram installation using the generated types, once
+for every build to compare (e.g. default, ``--slots`` and
+``--class-defaults``):
+
+    python benchmarks/update_memory.py [updates.json]
+
+The corpus is a JSON list of raw updates, as returned by getUpdates, and
+defaults to ``benchmarks/updates.json``.
+"""
+import argparse
+import copy
+import json
+import os
+import tracemalloc
+
+from pybotgram import types
+
+
+CORPUS = os.path.join(os.path.dirname(__file__), "updates.json")
+
+
+def measure(updates: list, rounds: int) -> tuple[int, int]:
+    # Decoding is not part of the measure, only the parsed objects are
+    raws = [copy.deepcopy(updates) for _ in range(rounds)]
+
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+
+    parsed = [
+        types.Update._parse(update, None)
+        for batch in raws
+        for update in batch
+    ]
+
+    size = sum(
+        x.size_diff
+        for x in tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+    )
+    tracemalloc.stop()
+
+    return size, len(parsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "corpus", 
+        nargs="?", 
+        default=CORPUS, 
+        help="JSON list of updates"
+    )
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    with open(args.corpus) as f:
+        updates = json.load(f)
+
+    size, count = measure(updates, args.rounds)
+    print(f"{count} updates: {size / count:.0f} bytes per Update")
+
+
+if __name__ == "__main__":
+    main()
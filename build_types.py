@@ -1,34 +1,70 @@
+import argparse
+import copy
+import functools
+import hashlib
+import fnmatch
 import json
-import re
+import os
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
+import api_ir
+from api_ir import Field, TypeRef, camel_to_snake
 
-TYPES = {
-    "String": "str", 
-    "Boolean": "bool", 
-    "Integer": "int", 
-    "Float": "float"
-}
 
-
-def camel_to_snake(name):
-    # https://stackoverflow.com/q/1175208
-    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+# Bump whenever the generated output changes for a reason the manifest
+# can't see (the sources of the generator are part of every hash already)
+GENERATOR_VERSION = "4"
+MANIFEST = ".build_manifest.json"
+FORMAT_CACHE = ".format_cache.json"
+LINE_LENGTH = 79
 
 
 class Generator:
     def __init__(
         self,
         name: str, 
-        description: list[str], 
-        fields: list[str], 
-        subtypes: list[str]
+        description: tuple[str, ...], 
+        fields: tuple[Field, ...], 
+        subtypes: tuple[str, ...],
+        slots: bool = False,
+        sparse: bool = False,
+        class_defaults: bool = False,
+        owned: bool = False,
+        lazy: list[str] = (),
+        projection: bool = False,
+        table: bool = False,
+        bundle: bool = False,
+        docstrings: bool = True,
+        base: Optional[str] = None,
+        inherited: list[str] = (),
+        constants: Optional[dict] = None,
+        discriminator: Optional[str] = None,
+        variants: list[tuple] = ()
     ):
         self.name = name
         self.description = description
         self.fields = fields
         self.subtypes = subtypes
+        self.slots = slots
+        self.sparse = sparse
+        self.class_defaults = class_defaults
+        self.owned = owned
+        self.lazy = lazy
+        self.projection = projection
+        self.table = table
+        self.bundle = bundle
+        self.docstrings = docstrings
+        # Subtypes: the base class, the names of the fields it declares and
+        # the values fixed by the subtype
+        self.base = base
+        self.inherited = inherited
+        self.constants = constants or {}
+        # Base classes: the field routing to the subtypes and the
+        # (value, key, subtype) entries of the dispatch table
+        self.discriminator = discriminator
+        self.variants = variants
 
     def get_file_name(self):
         return camel_to_snake(self.name)
@@ -37,6 +73,10 @@ class Generator:
         description = ""
 
         for i, x in enumerate(self.description):
+            if x[2:] in self.subtypes:
+                # - ChatMemberOwner --> - :obj:`~pybotgram.types.ChatMemberOwner`
+                x = f"- {self.types_to_description(TypeRef(x[2:]))}"
+
             description += textwrap.fill(
                 x,
                 initial_indent="" if i == 0 else "\n    ",
@@ -44,16 +84,13 @@ class Generator:
                 break_long_words=False
             )
 
-        if self.fields:
+        fields = self.get_public_fields()
+
+        if fields:
             description += "\n\n    Parameters:"
 
-        for i, x in enumerate(self.fields):
-            field = self.get_description_field(
-                x["name"],
-                x["types"],
-                x["required"],
-                x["description"]
-            )
+        for i, x in enumerate(fields):
+            field = self.get_description_field(x)
             if i == 0:
                 description += f"\n{field}"
             else:
@@ -61,87 +98,590 @@ class Generator:
 
         return description
 
+    def get_docstring(self):
+        if not self.docstrings:
+            return ""
+
+        return f"\n    \"\"\"{self.get_description()}\n    \"\"\""
+
     def get_arguments(self):
         arguments = ""
+        fields = self.get_public_fields()
 
-        if self.fields or self.subtypes:
+        if fields:
             arguments += "\n        *,"
 
-        for x in self.fields:
-            arguments += "\n        "
-
-            if x["name"] == "from":
-                arguments += "from_user: "
-            else:
-                arguments += f"{x['name']}: "
-            
-            types = x["types"]
-            if len(types)==1:
-                data = self.types_to_type(types[0])
-                arguments += f"Optional[{data}]" if not x["required"] else data
-            else:
-                data = ", ".join(map(self.types_to_type, types))
-                if not x["required"]:
-                    arguments += f"Optional[Union[{data}]]"
-                else:
-                    arguments += f"Union[{data}]"
-            
-            arguments += " = None," if not x["required"] else ","
+        for x in fields:
+            arguments += f"\n        {x.attribute}: "
+            arguments += self.get_annotation(x)
+            arguments += " = None," if not x.required else ","
         
         return arguments
 
+    def get_annotation(self, field):
+        types = field.types
+        if len(types)==1:
+            data = self.types_to_type(types[0])
+        else:
+            data = f"Union[{', '.join(map(self.types_to_type, types))}]"
+
+        return f"Optional[{data}]" if not field.required else data
+
+    def get_stub_attributes(self):
+        attributes = ""
+
+        for x in self.get_own_fields():
+            attributes += f"\n    {x.attribute}: {self.get_annotation(x)}"
+
+        return attributes
+
+    def get_stub_methods(self):
+        methods = ""
+
+        if self.owned:
+            methods += (
+                "\n\n    @classmethod"
+                "\n    def _parse_owned("
+                "\n        cls, data: Dict[str, Any], bot: \"pybotgram.Bot\""
+                f"\n    ) -> Optional[\"{self.name}\"]: ..."
+            )
+
+        if self.is_one_of():
+            methods += (
+                "\n\n    @classmethod"
+                "\n    def _parser("
+                "\n        cls, allowed_updates: Optional[Iterable[str]] = None"
+                "\n    ) -> Callable[[Dict[str, Any], \"pybotgram.Bot\"], "
+                f"Optional[\"{self.name}\"]]: ..."
+            )
+
+        return methods
+
     def get_fields(self):
         fields = ""
 
-        for x in self.fields:
+        for x in self.get_own_fields():
             fields += "\n        "
 
-            if x["name"] == "from":
-                fields += "self.from_user = from_user"
-            else:
-                fields += f"self.{x['name']} = {x['name']}"
+            if self.class_defaults and not x.required:
+                # Absent fields fall back to the class-level default
+                fields += f"if {x.attribute} is not None:\n            "
+
+            fields += f"self.{x.attribute} = {x.attribute}"
         
         return fields
 
-    def get_instructions(self):
+    def get_attributes(self):
+        if self.slots:
+            return self.get_slots()
+
+        attributes = ""
+
+        for x in self.get_own_fields():
+            if self.is_lazy(x):
+                # Absent lazy fields are served as None by the descriptor
+                attributes += f"\n    {x.attribute} = LazyField()"
+            elif self.class_defaults and not x.required:
+                attributes += f"\n    {x.attribute} = None"
+
+        return f"\n{attributes}" if attributes else ""
+
+    def get_public_fields(self):
+        # Fixed values are set by the subtype, they aren't arguments
+        return [x for x in self.fields if x.name not in self.constants]
+
+    def get_own_fields(self):
+        # Inherited fields are declared and assigned by the base class
+        return [
+            x for x in self.get_public_fields()
+            if x.name not in self.inherited
+        ]
+
+    def get_super_arguments(self):
+        arguments = []
+
+        for x in self.inherited:
+            if x in self.constants:
+                arguments.append(f"{x}=\"{self.constants[x]}\"")
+            elif x == "from":
+                arguments.append("from_user=from_user")
+            else:
+                arguments.append(f"{x}={x}")
+
+        return ", ".join(arguments)
+
+    def has_lazy(self):
+        return any(self.is_lazy(x) for x in self.fields)
+
+    def get_slots(self):
+        if not self.slots:
+            return ""
+
+        names = [f"\"{x.attribute}\"" for x in self.get_own_fields()]
+
+        if len(names) == 1:
+            return f"\n\n    __slots__ = ({names[0]},)"
+        return f"\n\n    __slots__ = ({', '.join(names)})"
+
+    def get_constant(self, suffix):
+        return f"_{camel_to_snake(self.name).upper()}_{suffix}"
+
+    def get_handlers(self):
+        # Wire name -> (attribute name, parser) for every field that is
+        # either renamed or parsed, the others are passed through as-is
+        handlers = ""
+
+        for x in self.fields:
+            parser = None
+            i = self.field_expression(x, "value")
+            if i:
+                parser = f"lambda value, bot: {i}"
+
+            if parser is None and x.name == x.attribute:
+                continue
+
+            handlers += f"\n    \"{x.name}\": (\"{x.attribute}\", {parser}),"
+
+        if not handlers:
+            return ""
+
+        return f"{self.get_constant('FIELDS')} = {{{handlers}\n}}\n\n\n"
+
+    def get_spec(self):
+        # (wire name, attribute name, parser, list depth) for every field
+        # that is either renamed or parsed, interpreted by parse_table.
+        # Types are named rather than referenced, their modules are only
+        # imported once a field of that type is parsed
+        spec = ""
+
+        for x in self.fields:
+            parser = None
+            depth = 0
+
+            if len(x.types) != 1:
+                parser = self.field_parser(x) or None
+            elif not x.types[0].scalar:
+                parser = f"\"{x.types[0].name}\""
+                depth = x.types[0].depth
+
+            if parser is None and x.name == x.attribute:
+                continue
+
+            spec += f"\n    (\"{x.name}\", \"{x.attribute}\", {parser}, {depth}),"
+
+        if not spec:
+            return ""
+
+        return f"{self.get_constant('SPEC')} = ({spec}\n)\n\n\n"
+
+    def get_parse_arguments(self):
+        if not self.projection:
+            return ""
+
+        return ",\n        projection: Optional[Iterable[str]] = None"
+
+    def get_projection(self):
+        if not self.projection:
+            return ""
+
+        return (
+            "\n        if projection is not None:"
+            "\n            return parse_projection(cls, data, bot, projection)"
+            "\n"
+        )
+
+    def get_parse(self):
+        # Base classes check the projection before their dispatch
+        parse = "" if self.subtypes else self.get_projection()
+
+        if self.table:
+            spec = self.get_constant("SPEC") if self.get_spec() else "()"
+            return parse + f"\n        return parse_table(cls, data, bot, {spec})"
+
+        if not self.sparse:
+            return parse + (
+                "\n        data = data.copy()"
+                f"\n        {self.get_instructions()}"
+                "\n        return cls(bot=bot, **data)"
+            )
+
+        if not self.get_handlers():
+            return parse + "\n        return cls(bot=bot, **data)"
+
+        # Only the keys that are actually present are visited
+        return parse + (
+            "\n        kwargs = {}"
+            "\n        for key, value in data.items():"
+            f"\n            handler = {self.get_constant('FIELDS')}.get(key)"
+            "\n            if handler is None:"
+            "\n                kwargs[key] = value"
+            "\n            else:"
+            "\n                name, parse = handler"
+            "\n                kwargs[name] = value if parse is None "
+            "else parse(value, bot)"
+            "\n\n        return cls(bot=bot, **kwargs)"
+        )
+
+    def get_tables(self):
+        tables = ""
+
+        if self.sparse:
+            tables += self.get_handlers()
+
+        if self.table:
+            tables += self.get_spec()
+
+        if self.owned and not self.slots:
+            attributes = ", ".join(f"\"{x.attribute}\"" for x in self.fields)
+            tables += (
+                f"{self.get_constant('ATTRIBUTES')} = "
+                f"frozenset(({attributes}{',' if len(self.fields) == 1 else ''}))"
+                "\n\n\n"
+            )
+
+        if self.owned and not (self.slots or self.class_defaults):
+            absent = "".join(
+                f"\n    \"{x.attribute}\": None,"
+                for x in self.fields
+                if not x.required
+            )
+            tables += f"{self.get_constant('ABSENT')} = {{{absent}\n}}\n\n\n"
+
+        return tables
+
+    def get_helpers(self):
+        # Module-level parsers, by name: the classes of a module can share
+        # them, so they're emitted once per module
+        helpers = {}
+
+        for owned in (False, True) if self.owned else (False,):
+            for x in self.fields:
+                members = x.types
+
+                if len(x.types) != 1:
+                    if self.get_union_checks(x.types, owned):
+                        name = self.get_union_name(x.types, owned)
+                        helpers[name] = self.get_union_parser(x.types, owned)
+                    else:
+                        members = ()
+                elif self.table and not owned:
+                    # The table builds the list parsers itself
+                    members = ()
+
+                for types in members:
+                    if self.has_list_parser(types, owned):
+                        name = self.get_nested_list_name(types, owned)
+                        helpers[name] = self.get_nested_list_parser(
+                            types, 
+                            owned
+                        )
+
+        return helpers
+
+    def has_list_parser(self, types, owned=False):
+        # Nested lists, and the lists of _parse_owned which has no
+        # _parse_list counterpart, are parsed by a module-level helper
+        if types.scalar:
+            return False
+
+        return types.depth > 1 or bool(owned and types.depth)
+
+    def get_nested_list_name(self, types, owned=False):
+        # Array of Array of PhotoSize --> _parse_photo_size_list_list
+        name = camel_to_snake(types.name) + "_list" * types.depth
+        return f"_parse_{name}{'_owned' if owned else ''}"
+
+    def get_nested_list_parser(self, types, owned=False):
+        depth = types.depth
+        method = "_parse_owned" if owned else "_parse"
+
+        # [[parse(x0, bot) for x0 in x1] for x1 in data]
+        comprehension = "parse(x0, bot)"
+        for i in range(depth):
+            source = "data" if i == depth - 1 else f"x{i + 1}"
+            comprehension = f"[{comprehension} for x{i} in {source}]"
+
+        return (
+            f"def {self.get_nested_list_name(types, owned)}("
+            "\n    data: Any, bot: \"pybotgram.Bot\""
+            f"\n) -> Optional[{self.types_to_type(types)}]:"
+            "\n    if not isinstance(data, list):"
+            "\n        return None"
+            "\n\n    # The element parser is looked up once, not once per element"
+            f"\n    parse = {self.types_to_reference(types.name)}.{method}"
+            f"\n    return {comprehension}"
+        )
+
+    def get_union_checks(self, types, owned=False):
+        # JSON type -> expression parsing it, members that are passed
+        # through (str, int, ...) have no check
+        checks = {}
+
+        for x in types:
+            expression = self.types_to_expression(x, "data", owned)
+            if not expression:
+                continue
+
+            kind = "list" if x.depth else "dict"
+            # Two members decoded from the same JSON type can't be told
+            # apart, those are left as they are
+            checks[kind] = None if kind in checks else expression
+
+        return {k: v for k, v in checks.items() if v is not None}
+
+    def get_union_name(self, types, owned=False):
+        # InputFile or String --> _parse_input_file_or_string
+        names = [camel_to_snake(x.name) + "_list" * x.depth for x in types]
+        return f"_parse_{'_or_'.join(names)}{'_owned' if owned else ''}"
+
+    def get_union_parser(self, types, owned=False):
+        checks = ""
+
+        for kind, expression in self.get_union_checks(types, owned).items():
+            checks += (
+                f"\n    if isinstance(data, {kind}):"
+                f"\n        return {expression}"
+            )
+
+        members = ", ".join(map(self.types_to_type, types))
+
+        return (
+            f"def {self.get_union_name(types, owned)}("
+            "\n    data: Any, bot: \"pybotgram.Bot\""
+            f"\n) -> Optional[Union[{members}]]:"
+            "\n    # The member is told apart by the JSON type of the value"
+            f"{checks}"
+            "\n\n    return data"
+        )
+
+    def get_references(self):
+        # Names of the types the fields are parsed into
+        references = set()
+
+        for x in self.fields:
+            for types in x.types:
+                if not types.scalar:
+                    references.add(types.name)
+
+        return references
+
+    def is_ambiguous(self):
+        values = [x[0] for x in self.variants]
+        return len(values) != len(set(values))
+
+    def get_dispatch(self, method="_parse"):
+        if not self.subtypes:
+            return ""
+
+        table = self.get_constant("TYPES")
+
+        if self.discriminator is None:
+            # Nothing tells the subtypes apart but their required fields
+            subtype = f"next((c for k, c in {table} if k in data), None)"
+        elif self.is_ambiguous():
+            # Subtypes sharing a value are told apart by a required field,
+            # the last candidate (k is None) takes what's left
+            subtype = (
+                f"next((c for k, c in {table}.get("
+                f"data.get(\"{self.discriminator}\"), ()) "
+                "if k is None or k in data), None)"
+            )
+        else:
+            subtype = f"{table}.get(data.get(\"{self.discriminator}\"))"
+
+        projection = ""
+        if method == "_parse":
+            # The paths are checked against every subtype, the projection
+            # picks the subtype the same way as below
+            projection = self.get_projection()
+
+        return projection + (
+            f"\n        if cls is {self.name}:"
+            f"\n            subtype = {subtype}"
+            "\n            if subtype is not None:"
+            f"\n                return subtype.{method}(data, bot)"
+            "\n"
+        )
+
+    def get_dispatch_table(self):
+        if not self.subtypes:
+            return ""
+
+        table = ""
+
+        if self.discriminator is None:
+            for _, key, name in self.variants:
+                table += f"\n    (\"{key}\", {name}),"
+
+            return f"{self.get_constant('TYPES')} = ({table}\n)\n"
+
+        if not self.is_ambiguous():
+            for value, _, name in self.variants:
+                table += f"\n    \"{value}\": {name},"
+
+            return f"{self.get_constant('TYPES')} = {{{table}\n}}\n"
+
+        candidates = {}
+
+        for value, key, name in self.variants:
+            key = "None" if key is None else f"\"{key}\""
+            candidates.setdefault(value, []).append(f"({key}, {name})")
+
+        for value, x in candidates.items():
+            table += f"\n    \"{value}\": ({', '.join(x)},),"
+
+        return f"{self.get_constant('TYPES')} = {{{table}\n}}\n"
+
+    def get_methods(self):
+        return self.get_parse_owned() + self.get_kind_parser()
+
+    def is_one_of(self):
+        return any(
+            "At most one of the optional parameters can be present" in x
+            for x in self.description
+        )
+
+    def get_kind_parser(self):
+        if not self.is_one_of():
+            return ""
+
+        fields = ""
+        kinds = ""
+
+        # Keys are parsed and renamed the same way as in _parse
+        for x in self.fields:
+            parser = self.field_parser(x)
+            if parser and self.is_lazy(x):
+                parser = f"lambda value, bot: lazy({parser}, value, bot)"
+            if parser or x.name != x.attribute:
+                fields += (
+                    f"\n            \"{x.name}\": "
+                    f"(\"{x.attribute}\", {parser or None}),"
+                )
+            if parser and not x.required:
+                kinds += f"\n            \"{x.name}\","
+
+        return (
+            "\n\n    @classmethod"
+            "\n    def _parser("
+            "\n        cls, allowed_updates: Optional[Iterable[str]] = None"
+            "\n    ) -> Callable[[Dict[str, Any], \"pybotgram.Bot\"], "
+            f"Optional[\"{self.name}\"]]:"
+            f"\n        fields = {{{fields}\n        }}"
+            "\n        # At most one kind is present, so only its branch is"
+            "\n        # parsed and the kinds which are not allowed are ignored"
+            f"\n        kinds = {{{kinds}\n        }}"
+            "\n        ignored = set()"
+            "\n\n        if allowed_updates is not None:"
+            "\n            ignored = kinds - set(allowed_updates)"
+            "\n\n        def parse("
+            "\n            data: Dict[str, Any], bot: \"pybotgram.Bot\""
+            f"\n        ) -> Optional[\"{self.name}\"]:"
+            "\n            if not (isinstance(data, dict) and data):"
+            "\n                return None"
+            "\n\n            kwargs = {}"
+            "\n            for key, value in data.items():"
+            "\n                if key in ignored:"
+            "\n                    continue"
+            "\n\n                field = fields.get(key)"
+            "\n                if field is None:"
+            "\n                    kwargs[key] = value"
+            "\n                    continue"
+            "\n\n                name, handler = field"
+            "\n                if handler is not None:"
+            "\n                    value = handler(value, bot)"
+            "\n                kwargs[name] = value"
+            "\n\n            return cls(bot=bot, **kwargs)"
+            "\n\n        return parse"
+        )
+
+    def get_parse_owned(self):
+        if not self.owned:
+            return ""
+
         instructions = ""
 
+        # Nested objects are parsed in place, only for the keys present
         for x in self.fields:
-            if len(x["types"])==1:
-                i = self.types_to_instructions(x["name"], x["types"][0])
+            i = self.field_expression(x, f"data[\"{x.name}\"]", owned=True)
+
+            if x.name != x.attribute:
+                value = f"data.pop(\"{x.name}\")"
                 if i:
-                    if x["name"] == "from":
-                        instructions += f"\n        data[\"from_user\"] = "
-                    else:
-                        instructions += f"\n        data[\"{x['name']}\"] = "
-                    instructions += i
+                    value = i.replace(f"data[\"{x.name}\"]", value)
+                instructions += (
+                    f"\n        if \"{x.name}\" in data:"
+                    f"\n            data[\"{x.attribute}\"] = {value}"
+                )
+            elif i:
+                instructions += (
+                    f"\n        if \"{x.name}\" in data:"
+                    f"\n            data[\"{x.name}\"] = {i}"
+                )
+
+        if self.slots:
+            instructions += "\n\n        obj = cls.__new__(cls)"
+            for x in self.fields:
+                instructions += (
+                    f"\n        obj.{x.attribute} = data.get(\"{x.attribute}\")"
+                )
+        else:
+            # Unknown keys are dropped, as __init__ does with **_kwargs
+            instructions += (
+                "\n\n        for key in data.keys() - "
+                f"{self.get_constant('ATTRIBUTES')}:"
+                "\n            del data[key]"
+                "\n\n        obj = cls.__new__(cls)"
+            )
+
+            if self.class_defaults:
+                instructions += "\n        obj.__dict__ = data"
+            else:
+                instructions += (
+                    "\n        obj.__dict__.update("
+                    f"{self.get_constant('ABSENT')})"
+                    "\n        obj.__dict__.update(data)"
+                )
+
+        return (
+            "\n\n    @classmethod"
+            "\n    def _parse_owned("
+            "\n        cls, data: Dict[str, Any], bot: \"pybotgram.Bot\""
+            f"\n    ) -> Optional[\"{self.name}\"]:"
+            "\n        # Takes ownership of data, which must come straight from"
+            "\n        # json.loads: it's modified in place and __init__ is skipped"
+            "\n        if not (isinstance(data, dict) and data):"
+            "\n            return None"
+            f"\n{self.get_dispatch('_parse_owned')}{instructions}"
+            "\n\n        return obj"
+        )
+
+    def get_instructions(self):
+        instructions = ""
+
+        for x in self.fields:
+            i = self.field_expression(x, f"data.get(\"{x.name}\")")
+            if i:
+                instructions += f"\n        data[\"{x.attribute}\"] = {i}"
         
         if instructions:
             instructions += "\n"
         
         return instructions
     
-    def get_description_field(
-        self, 
-        name: str, 
-        types: list[str], 
-        required: bool, 
-        description: str
-    ):
-        if name == "from":
-            field = f"        from_user ("
-        else:
-            field = f"        {name} ("
+    def get_description_field(self, x: Field):
+        types = x.types
+        field = f"        {x.attribute} ("
 
         if len(types) == 1:
             field += f"{self.types_to_description(types[0])}"
         else:
             field += " | ".join(map(self.types_to_description, types))
         
-        field += f"{self.is_optional(required)}):"
+        field += f"{self.is_optional(x.required)}):"
 
         field += textwrap.fill(
-            description.replace("Optional. ", ""),
+            x.description.replace("Optional. ", ""),
             initial_indent="\n            ",
             subsequent_indent="            ",
             break_long_words=False
@@ -151,108 +691,824 @@ class Generator:
 
         return field.replace("..", ".")
 
-    def types_to_description(self, types: str):
-        if TYPES.get(types, None):
-            return f":py:obj:`{TYPES[types]}`"
-        elif "Array" in types:
+    def types_to_description(self, types: TypeRef):
+        if types.depth:
             # Array of String --> List of ``str``
-            types_list = types.split("Array of ", maxsplit=1)[1]
-            return f"List of {self.types_to_description(types_list)}"
+            return f"List of {self.types_to_description(types.item)}"
+        elif types.scalar:
+            return f":py:obj:`{types.scalar}`"
         else:
-            return f":obj:`~pybotgram.types.{types}`"
+            return f":obj:`~pybotgram.types.{types.name}`"
+
+    def types_to_reference(self, name: str):
+        # A bundle defines every type in the same module
+        return name if self.bundle else f"types.{name}"
 
-    def types_to_type(self, types: str):
-        if TYPES.get(types, None):
-            return TYPES[types]
-        elif "Array" in types:
+    def types_to_type(self, types: TypeRef):
+        if types.depth:
             # Array of String --> List[str]
-            types_list = types.split("Array of ", maxsplit=1)[1]
-            return f"List[{self.types_to_type(types_list)}]"
+            return f"List[{self.types_to_type(types.item)}]"
+        elif types.scalar:
+            return types.scalar
         else:
-            return f"\"types.{types}\""
+            return f"\"{self.types_to_reference(types.name)}\""
+
+    def is_lazy(self, field):
+        # Inherited fields follow the patterns of the base class, which
+        # declares their descriptor
+        owner = self.base if field.name in self.inherited else self.name
+
+        return any(
+            fnmatch.fnmatchcase(f"{owner}.{field.name}", x)
+            for x in self.lazy
+        ) and bool(self.field_parser(field))
 
-    def types_to_instructions(self, name, types):
-        if TYPES.get(types, None):
+    def field_parser(self, field, owned=False):
+        if len(field.types) == 1:
+            return self.types_to_parser(field.types[0], owned)
+
+        if not self.get_union_checks(field.types, owned):
+            return False
+
+        return self.get_union_name(field.types, owned)
+
+    def field_expression(self, field, value, owned=False):
+        if self.is_lazy(field):
+            # The raw value is kept and parsed on first access
+            parser = self.field_parser(field, owned)
+            return f"lazy({parser}, {value}, bot)"
+
+        if len(field.types) != 1:
+            parser = self.field_parser(field, owned)
+            return f"{parser}({value}, bot)" if parser else False
+
+        return self.types_to_expression(field.types[0], value, owned)
+
+    def types_to_parser(self, types, owned=False):
+        if types.scalar:
             return False
-        elif "Array" in types:
-            nname = types.split("Array of ")[-1]
-            if not TYPES.get(nname, False):
-                return f"types.{nname}._parse_list(data.get(\"{name}\"), bot)"
+        elif types.depth > 1:
+            return self.get_nested_list_name(types, owned)
+        elif types.depth:
+            return f"{self.types_to_reference(types.name)}._parse_list"
+        else:
+            method = "_parse_owned" if owned else "_parse"
+            return f"{self.types_to_reference(types.name)}.{method}"
+
+    def types_to_expression(self, types, value, owned=False):
+        reference = self.types_to_reference(types.name)
+
+        if types.scalar:
             return False
+        elif self.has_list_parser(types, owned):
+            name = self.get_nested_list_name(types, owned)
+            return f"{name}({value}, bot)"
+        elif types.depth:
+            return f"{reference}._parse_list({value}, bot)"
         else:
-            return f"types.{types}._parse(data.get(\"{name}\"), bot)"
+            method = "_parse_owned" if owned else "_parse"
+            return f"{reference}.{method}({value}, bot)"
 
     is_optional = lambda _, optional: "" if optional else ", *optional*"
 
 
+def render_field_graph(api: api_ir.Api) -> str:
+    # Type -> wire name -> (attribute, type, list depth), where the type
+    # is None for fields that aren't parsed into an object
+    graph = ""
+    # Base type -> (discriminator, (value, key, subtype) in the order the
+    # dispatch of the base class tries them)
+    hierarchies = ""
+
+    for x in api.types.values():
+        fields = ""
+
+        for field in x.hierarchy.fields if x.hierarchy else x.fields:
+            types = field.types[0]
+
+            if len(field.types) != 1 or types.scalar:
+                name = None
+            else:
+                name = f"\"{types.name}\""
+
+            fields += (
+                f"\n        \"{field.name}\": "
+                f"(\"{field.attribute}\", {name}, {types.depth}),"
+            )
+
+        if fields:
+            graph += f"\n    \"{x.name}\": {{{fields}\n    }},"
+
+        if x.hierarchy:
+            variants = "".join(
+                f"({value!r}, {key!r}, \"{name}\"), "
+                for value, key, name in x.hierarchy.variants
+            )
+            hierarchies += (
+                f"\n    \"{x.name}\": "
+                f"({x.hierarchy.discriminator!r}, ({variants})),"
+            )
+
+    return (
+        f"FIELDS = {{{graph}\n}}\n"
+        f"\nSUBTYPES = {{{hierarchies}\n}}\n"
+    )
+
+
+def source_hash() -> str:
+    # Any change to the generator invalidates the manifest on its own
+    digest = hashlib.sha256()
+
+    for x in (__file__, api_ir.__file__):
+        with open(x, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def spec_hash(specs: list[api_ir.Type], salt: list[str]) -> str:
+    digest = hashlib.sha256(GENERATOR_VERSION.encode())
+
+    for x in salt:
+        digest.update(x.encode())
+
+    # The IR keeps a hash of every api.json entry
+    for x in specs:
+        digest.update(x.digest.encode())
+
+    return digest.hexdigest()
+
+
+def load_manifest() -> dict:
+    try:
+        with open(MANIFEST) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    # Leave untouched files alone so their mtime (and every .pyc built
+    # from them) stays valid
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(path, "w") as f:
+        f.write(content)
+
+    return True
+
+
+def render_classes(
+    classes: list[tuple[Generator, str]],
+    template_class: str,
+    template_subtypes: str
+) -> tuple[set[str], str, dict, list[str]]:
+    # A base class and its subtypes share the same module
+    import_set = {"Any", "Dict", "Optional"}
+    import_types = ""
+    helpers = {}
+    content = []
+
+    for gen, class_object in classes:
+        arguments = gen.get_arguments()
+
+        if arguments.find("types.") != -1:
+            import_types = "\nfrom pybotgram import types"
+        if arguments.find("Union") != -1:
+            import_set.add("Union")
+        if arguments.find("List") != -1:
+            import_set.add("List")
+        if gen.is_one_of():
+            import_set.update(("Callable", "Iterable"))
+
+        helpers.update(gen.get_helpers())
+        template = template_subtypes if gen.subtypes else template_class
+        content.append(gen.get_tables() + template.format(
+            name=gen.name,
+            class_object=class_object,
+            docstring=gen.get_docstring(),
+            attributes=gen.get_attributes(),
+            arguments=arguments,
+            fields=gen.get_fields(),
+            super_arguments=gen.get_super_arguments(),
+            parse_arguments=gen.get_parse_arguments(),
+            dispatch=gen.get_dispatch(),
+            parse=gen.get_parse(),
+            methods=gen.get_methods()
+        ))
+
+    gen = classes[0][0]
+
+    if any(x.has_lazy() for x, _ in classes):
+        import_types += "\nfrom ._runtime import LazyField, lazy"
+    if gen.projection:
+        import_set.add("Iterable")
+        import_types += "\nfrom ._runtime import parse_projection"
+    if gen.table:
+        import_types += "\nfrom ._runtime import parse_table"
+    if gen.subtypes:
+        # Built once, after every subtype is defined
+        content.append(gen.get_dispatch_table())
+
+    return import_set, import_types, helpers, content
+
+
+def render_type(
+    classes: list[tuple[Generator, str]],
+    template_types: str,
+    template_class: str,
+    template_subtypes: str
+) -> str:
+    import_set, import_types, helpers, content = render_classes(
+        classes, 
+        template_class, 
+        template_subtypes
+    )
+
+    return template_types.format(
+        # Ties are broken by name, set order changes between processes
+        import_typing=", ".join(sorted(
+            import_set, 
+            key=lambda x: (-len(x), x)
+        )),
+        import_types=import_types,
+        content="\n\n\n".join([*helpers.values(), *content])
+    )
+
+
+def render_stub(
+    units: list[list[tuple[Generator, str]]],
+    template_stub: str,
+    template_stub_class: str
+) -> str:
+    # Signatures only, for type checkers: one stub per module, or a
+    # single one for a bundle
+    import_set = {"Any", "Dict", "Optional"}
+    content = []
+
+    for gen, class_object in (x for unit in units for x in unit):
+        arguments = gen.get_arguments()
+
+        if arguments.find("Union") != -1:
+            import_set.add("Union")
+        if arguments.find("List") != -1:
+            import_set.add("List")
+        if gen.is_one_of():
+            import_set.update(("Callable", "Iterable"))
+        if gen.projection:
+            import_set.add("Iterable")
+
+        content.append(template_stub_class.format(
+            name=gen.name,
+            class_object=class_object,
+            description=gen.get_description(),
+            attributes=gen.get_stub_attributes(),
+            arguments=arguments,
+            parse_arguments=gen.get_parse_arguments(),
+            methods=gen.get_stub_methods()
+        ))
+
+    content = "\n\n".join(content)
+
+    return template_stub.format(
+        import_typing=", ".join(sorted(
+            import_set, 
+            key=lambda x: (-len(x), x)
+        )),
+        import_types=(
+            "\nfrom pybotgram import types" 
+            if content.find("types.") != -1 else ""
+        ),
+        content=content
+    )
+
+
+def topological_order(units: list[list[tuple[Generator, str]]]) -> list:
+    # Every unit (a type, or a base class with its subtypes) comes after
+    # the ones its fields refer to, cycles are broken in api.json order
+    owners = {gen.name: i for i, x in enumerate(units) for gen, _ in x}
+    order = []
+    seen = set()
+
+    def visit(i):
+        if i in seen:
+            return
+        seen.add(i)
+
+        for gen, _ in units[i]:
+            for x in sorted(gen.get_references()):
+                if x in owners:
+                    visit(owners[x])
+
+        order.append(units[i])
+
+    for i in range(len(units)):
+        visit(i)
+
+    return order
+
+
+def render_bundle(
+    units: list[list[tuple[Generator, str]]],
+    template_bundle: str,
+    template_class: str,
+    template_subtypes: str
+) -> str:
+    import_set = set()
+    import_types = []
+    helpers = {}
+    content = []
+
+    for x in topological_order(units):
+        i = render_classes(x, template_class, template_subtypes)
+        import_set.update(i[0])
+        import_types.extend(
+            y for y in i[1].splitlines() if y and y not in import_types
+        )
+        helpers.update(i[2])
+        content.extend(i[3])
+
+    return template_bundle.format(
+        import_typing=", ".join(sorted(
+            import_set, 
+            key=lambda x: (-len(x), x)
+        )),
+        import_types="".join(f"\n{x}" for x in import_types),
+        lst_all=",\n    ".join(
+            f"\"{gen.name}\"" for x in units for gen, _ in x
+        ),
+        content="\n\n\n".join([*helpers.values(), *content])
+    )
+
+
+@functools.cache
+def load_formatter(pyi: bool = False):
+    # Importing black and building its mode is done once per process
+    import black
+
+    return functools.partial(
+        black.format_str,
+        mode=black.Mode(line_length=LINE_LENGTH, is_pyi=pyi)
+    )
+
+
+def format_module(content: str, pyi: bool = False) -> str:
+    return load_formatter(pyi)(content)
+
+
+def text_hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+@functools.cache
+def formatter_version(pyi: bool = False) -> str:
+    # Guards against a black other than the pinned one, which may format
+    # the same text otherwise
+    import black
+
+    return f"black={black.__version__},{LINE_LENGTH=},{pyi=}"
+
+
+def format_hash(content: str, pyi: bool = False) -> str:
+    return text_hash(formatter_version(pyi) + content)
+
+
+def load_format_cache() -> dict:
+    try:
+        with open(FORMAT_CACHE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def pool_map(
+    pool: Optional[ProcessPoolExecutor], 
+    workers: int, 
+    func, 
+    *iterables
+) -> list:
+    if pool is None:
+        return list(map(func, *iterables))
+
+    # pool.map keeps the input order, so the output is the same as
+    # the one of a serial run
+    return list(pool.map(
+        func, 
+        *iterables, 
+        chunksize=max(1, len(iterables[0]) // (workers * 4))
+    ))
+
+
 def main():
-    with open("api.json", "r") as f:
-        docs = json.load(f)
-    
+    parser = argparse.ArgumentParser(description="Generate pybotgram types")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every type, ignoring the manifest"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes, 0 uses every core"
+    )
+    parser.add_argument(
+        "--no-format",
+        action="store_true",
+        help="write the template output without formatting it with black"
+    )
+    parser.add_argument(
+        "--slots",
+        action="store_true",
+        help="emit __slots__ for every field, along with a slotted Object"
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="parse only the keys present in the data, through a table"
+    )
+    parser.add_argument(
+        "--class-defaults",
+        action="store_true",
+        help="keep absent optional fields off the instances"
+    )
+    parser.add_argument(
+        "--owned",
+        action="store_true",
+        help="add _parse_owned, which reuses freshly decoded JSON in place"
+    )
+    parser.add_argument(
+        "--lazy",
+        action="append",
+        default=[],
+        metavar="TYPE.FIELD",
+        help="parse the matching fields on first access, e.g. "
+        "Message.reply_to_message or Message.* (can be repeated)"
+    )
+    parser.add_argument(
+        "--projection",
+        action="store_true",
+        help="let _parse decode only a set of field paths"
+    )
+    parser.add_argument(
+        "--table",
+        action="store_true",
+        help="parse through a field table per class and a shared loop, "
+        "instead of a dedicated _parse"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=("dev", "prod"),
+        default="dev",
+        help="prod leaves the docstrings out of the modules, --stubs "
+        "keeps them in the stubs"
+    )
+    parser.add_argument(
+        "--stubs",
+        action="store_true",
+        help="write a .pyi stub next to every generated module"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="write every type to types/__init__.py instead of a module each"
+    )
+    args = parser.parse_args()
+
+    if args.slots and args.class_defaults:
+        parser.error("--class-defaults can't be used with --slots")
+    if args.slots and args.lazy:
+        parser.error("--lazy can't be used with --slots")
+    if args.table and (args.sparse or args.lazy):
+        parser.error("--table can't be used with --sparse or --lazy")
+
+    workers = args.jobs or os.cpu_count() or 1
+
+    api = api_ir.load()
+
     with open("templates/types_class.txt") as f:
         template_class = f.read()
     
+    with open("templates/types_subtypes.txt") as f:
+        template_subtypes = f.read()
+
     with open("templates/types.txt") as f:
         template_types = f.read()
     
     with open("templates/init.txt") as f:
         template_init = f.read()
 
+    with open("templates/bundle.txt") as f:
+        template_bundle = f.read()
+
+    with open("templates/stub.txt") as f:
+        template_stub = f.read()
+
+    with open("templates/stub_class.txt") as f:
+        template_stub_class = f.read()
+
+    # Read even with --force, to remove the modules of dropped types
+    old_manifest = load_manifest()
+    manifest = {}
     lst_types = []
+    units = []
+    jobs = []
+    paths = []
+    options = [
+        f"format={not args.no_format}", 
+        # Formatted modules are rebuilt when black or its mode changes
+        "" if args.no_format else formatter_version(), 
+        f"slots={args.slots}",
+        f"sparse={args.sparse}",
+        f"class_defaults={args.class_defaults}",
+        f"owned={args.owned}",
+        f"lazy={sorted(args.lazy)}",
+        f"projection={args.projection}",
+        f"table={args.table}",
+        f"profile={args.profile}"
+    ]
     
-    for x in docs["types"].values():
-        name = x["name"]
-        subtypes = x.get("subtypes", [])
-        class_object = x.get("subtype_of", "Object")
+    salt = [
+        source_hash(), 
+        template_types, 
+        template_class, 
+        template_subtypes, 
+        *options
+    ]
+
+    flags = {
+        "slots": args.slots,
+        "sparse": args.sparse,
+        "class_defaults": args.class_defaults,
+        "owned": args.owned,
+        "lazy": args.lazy,
+        "projection": args.projection,
+        "table": args.table,
+        "bundle": args.bundle,
+        "docstrings": args.profile != "prod"
+    }
+
+    for x in api.types.values():
+        name = x.name
 
-        if subtypes:
-            print(f"FIX {name}")
+        if x.subtype_of:
+            # Generated along with the base class
             continue
-        elif isinstance(class_object, list):
+
+        specs = [x]
+        classes = []
+
+        if x.hierarchy:
+            hierarchy = x.hierarchy
+            classes.append((Generator(
+                name, 
+                x.description, 
+                hierarchy.fields, 
+                x.subtypes,
+                discriminator=hierarchy.discriminator,
+                variants=hierarchy.variants,
+                **flags
+            ), "Object"))
+
+            for y in x.subtypes:
+                spec = api.types[y]
+                specs.append(spec)
+                classes.append((Generator(
+                    y, 
+                    spec.description, 
+                    spec.fields, 
+                    (),
+                    base=name,
+                    inherited=[z.name for z in hierarchy.fields],
+                    constants=hierarchy.constants[y],
+                    **flags
+                ), name))
+        else:
+            classes.append((Generator(
+                name, 
+                x.description, 
+                x.fields, 
+                x.subtypes,
+                **flags
+            ), "Object"))
+
+        file_name = x.file_name
+        path = f"types/{file_name}.py"
+
+        lst_types.extend((gen.name, file_name) for gen, _ in classes)
+        units.append(classes)
+
+        if args.bundle:
+            # No module of its own. The manifest isn't committed, so the
+            # module of a per-type build is removed whether it lists it
+            # or not (its stub goes with the other stubs below)
+            if os.path.exists(path):
+                os.remove(path)
             continue
 
-        gen = Generator(name, x["description"], x.get("fields", []), subtypes)
-        file_name = gen.get_file_name()
+        h = spec_hash(specs, salt)
+        old = old_manifest.get(name, {})
+        manifest[name] = {"file": file_name, "hash": h}
 
-        lst_types.append((name, file_name))
-            
-        import_set = {"Any", "Dict", "Optional"}
-        import_types = ""
-        arguments = gen.get_arguments()
+        if (
+            not args.force and
+            old.get("file") == file_name and 
+            old.get("hash") == h and 
+            os.path.exists(path)
+        ):
+            manifest[name]["format"] = old.get("format")
+            continue
 
-        if arguments.find("types.") != -1:
-            import_types += "\nfrom pybotgram import types"
-        if arguments.find("Union") != -1:
-            import_set.add("Union")
-        if arguments.find("List") != -1:
-            import_set.add("List")
+        jobs.append(classes)
+        paths.append(path)
+
+    pool = None
+    if workers > 1 and len(jobs) > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
 
-        with open(f"types/{file_name}.py", "w") as f:
-            f.write(template_types.format(
-                import_typing=", ".join(sorted(
-                    import_set, 
-                    key=len, 
-                    reverse=True
-                )),
-                import_types=import_types,
-                content=template_class.format(
-                    name=name,
-                    class_object=class_object,
-                    description=gen.get_description(),
-                    arguments=gen.get_arguments(),
-                    fields=gen.get_fields(),
-                    instructions=gen.get_instructions()
+    try:
+        contents = pool_map(
+            pool,
+            workers,
+            functools.partial(
+                render_type,
+                template_types=template_types,
+                template_class=template_class,
+                template_subtypes=template_subtypes
+            ),
+            jobs
+        )
+
+        if not args.no_format:
+            # Modules whose template output was already formatted once
+            # are taken from the cache instead of going through black
+            cache = load_format_cache()
+            keys = [format_hash(x) for x in contents]
+            missing = sorted({
+                k: x 
+                for k, x in zip(keys, contents) 
+                if k not in cache
+            }.items())
+
+            cache.update(zip(
+                [x[0] for x in missing],
+                pool_map(
+                    pool, 
+                    workers, 
+                    format_module, 
+                    [x[1] for x in missing]
                 )
             ))
+            contents = [cache[k] for k in keys]
+
+            for classes, k in zip(jobs, keys):
+                manifest[classes[0][0].name]["format"] = k
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for classes, path, content in zip(jobs, paths, contents):
+        if write_if_changed(path, content):
+            print(f"Generated {classes[0][0].name}")
 
-    with open("types/__init__.py", "w") as f:
-        f.write(template_init.format(
+    # Drop modules of types that no longer exist in api.json
+    for name, entry in old_manifest.items():
+        if name not in manifest:
+            path = f"types/{entry['file']}.py"
+            if os.path.exists(path):
+                os.remove(path)
+                print(f"Removed {name}")
+            if os.path.exists(f"{path}i"):
+                os.remove(f"{path}i")
+
+    if args.bundle:
+        init = render_bundle(
+            units, 
+            template_bundle, 
+            template_class, 
+            template_subtypes
+        )
+    else:
+        init = template_init.format(
             lst_all=",\n    ".join([f"\"{x[0]}\"" for x in lst_types]),
-            lst_import="\n".join([
+            lst_modules=",\n    ".join([
+                f"\"{x[0]}\": \"{x[1]}\"" 
+                for x in lst_types
+            ]),
+            lst_import="\n    ".join([
                 f"from .{x[1]} import {x[0]}" 
                 for x in lst_types
             ])
-        ))
+        )
+
+    if not args.no_format:
+        init_key = format_hash(init)
+        if init_key not in cache:
+            cache[init_key] = format_module(init)
+        init = cache[init_key]
+
+    write_if_changed("types/__init__.py", init)
+
+    if args.profile == "prod":
+        # Size of the docstrings a dev build would carry
+        saved = 0
+        for x in units:
+            for gen, _ in x:
+                dev = copy.copy(gen)
+                dev.docstrings = True
+                saved += len(dev.get_docstring().encode())
+        print(f"Left out {saved} bytes of docstrings")
+
+    # Stubs are rendered on every run, black only sees the changed ones
+    stubs = {}
+    stub_keys = set()
+
+    if args.stubs and args.bundle:
+        stubs["__init__"] = render_stub(
+            units, 
+            template_stub, 
+            template_stub_class
+        )
+    elif args.stubs:
+        for x in units:
+            stubs[x[0][0].get_file_name()] = render_stub(
+                [x], 
+                template_stub, 
+                template_stub_class
+            )
+
+    for file_name in ["__init__", *(x[0][0].get_file_name() for x in units)]:
+        path = f"types/{file_name}.pyi"
+
+        if file_name not in stubs:
+            # Left over by a build with --stubs
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+
+        content = stubs[file_name]
+
+        if not args.no_format:
+            key = format_hash(content, pyi=True)
+            if key not in cache:
+                cache[key] = format_module(content, pyi=True)
+            stub_keys.add(key)
+            content = cache[key]
+
+        write_if_changed(path, content)
+
+    if args.projection:
+        graph = render_field_graph(api)
+
+        if not args.no_format:
+            graph = format_module(graph)
+
+        write_if_changed("types/_fields.py", graph)
+    elif os.path.exists("types/_fields.py"):
+        # Left over by a build with --projection
+        os.remove("types/_fields.py")
+
+    if args.lazy or args.projection or args.table:
+        with open("templates/runtime.txt") as f:
+            template_runtime = f.read()
+
+        if not args.no_format:
+            template_runtime = format_module(template_runtime)
+
+        write_if_changed("types/_runtime.py", template_runtime)
+    elif os.path.exists("types/_runtime.py"):
+        # Left over by a build with --lazy, --projection or --table
+        os.remove("types/_runtime.py")
+
+    if args.slots:
+        # Slots only save memory when every base class is slotted too
+        with open("templates/object.txt") as f:
+            template_object = f.read()
+
+        if not args.no_format:
+            template_object = format_module(template_object)
+
+        write_if_changed("types/object.py", template_object)
+    elif os.path.exists("types/object.py"):
+        # Left over by a build with --slots
+        os.remove("types/object.py")
+
+    if not args.no_format:
+        # Only keep the entries still referenced by the manifest
+        used = {x.get("format") for x in manifest.values()}
+        used.add(init_key)
+        used.update(stub_keys)
+        with open(FORMAT_CACHE, "w") as f:
+            json.dump({k: v for k, v in cache.items() if k in used}, f)
+
+    with open(MANIFEST, "w") as f:
+        json.dump(manifest, f, indent=4)
 
 
 if __name__ == "__main__":
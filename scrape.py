@@ -1,5 +1,12 @@
+import argparse
+import datetime
+import functools
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
 import requests
 from bs4 import BeautifulSoup, Tag
@@ -12,10 +19,33 @@ TYPES = {
     "True": "Boolean",
     "Bool": "Boolean",
 }
-RESULT = {
-    "types": {},
-    "methods": {}
-}
+SCALARS = {"String", "Integer", "Float", "Boolean"}
+SNAPSHOTS = "snapshots"
+# Seconds to wait for the docs, so that an unattended run can't hang
+TIMEOUT = 30
+# Hash of every section of the docs, along with api.json
+SECTIONS = "api.sections.json"
+# Bump whenever a change to this script alters what is extracted from a
+# section, so that every section is extracted again on the next run
+SCRAPER_VERSION = "1"
+# Tags the sections of the docs are cut at, in the raw HTML
+CONTENT = re.compile(
+    r"<div[^>]*\bid=\"dev_page_content\"[^>]*>", 
+    re.IGNORECASE
+)
+DIV = re.compile(r"<(/?)div\b", re.IGNORECASE)
+BOUNDARY = re.compile(r"<(?:h3|h4|hr)\b", re.IGNORECASE)
+H4_END = re.compile(r"</h4\s*>", re.IGNORECASE)
+# The changelog at the top of the docs starts with the latest version
+VERSION = re.compile(r"Bot API (\d+(?:\.\d+)+)")
+VERSIONS = "versions"
+# Where a method's description tells what it returns
+RETURN = re.compile(
+    "(?:on success,|returns)([^.]*)(?:on success)?", 
+    re.IGNORECASE
+)
+RETURN_FALLBACK = re.compile("([^.]*)(?:is returned)", re.IGNORECASE)
+RETURN_ARRAY = re.compile(r"((?:array of )+\w*)", re.IGNORECASE)
 
 
 def get_description(t: Tag) -> list[str]:
@@ -53,81 +83,229 @@ def get_types_tg(t: str):
     return [f"{pref}{get_types(x)}" for x in types]
 
 
-def get_return(current_name):
-    desc = "\n".join(RESULT["methods"][current_name]["description"])
-    ret_search = re.search(
-        "(?:on success,|returns)([^.]*)(?:on success)?", 
-        desc, 
-        re.IGNORECASE
-    )
-    ret_search2 = re.search("([^.]*)(?:is returned)", desc, re.IGNORECASE)
-    if ret_search:
-        extract_return(current_name, ret_search.group(1))
+def get_type_tree(types: list[str]) -> dict:
+    # The same type as get_types_tg, as a tree of scalar, object, array
+    # and union nodes
+    if len(types) > 1 and all(x.startswith("Array of ") for x in types):
+        # Array of A, B --> Array of (A or B)
+        return {
+            "kind": "array",
+            "element": get_type_tree([x[len("Array of "):] for x in types])
+        }
+    elif len(types) > 1:
+        return {
+            "kind": "union",
+            "members": [get_type_tree([x]) for x in types]
+        }
+    elif types[0].startswith("Array of "):
+        return {
+            "kind": "array",
+            "element": get_type_tree([types[0][len("Array of "):]])
+        }
+    elif types[0] in SCALARS:
+        return {"kind": "scalar", "name": types[0]}
     else:
-        extract_return(current_name, ret_search2.group(1))
+        return {"kind": "object", "name": types[0]}
 
 
-def extract_return(c: str, t: str):
-    array_match = re.search(r"((?:array of )+\w*)", t, re.IGNORECASE)
-    if array_match:
-        types = get_types_tg(array_match.group(1))
-    else:
-        types = [
-            y 
-            for x in t.split() 
-            for y in get_types_tg(x) 
-            if x[0].isupper()
-        ]
-    
-    RESULT["methods"][c]["returns"] = types
+def add_type_trees(result: dict):
+    for x in ("types", "methods"):
+        for v in result[x].values():
+            for field in v.get("fields", []):
+                field["type"] = get_type_tree(field["types"])
+
+
+def load_index(store: str) -> dict:
+    # Snapshots by file name, along with the validators they were served
+    # with, and the name of the latest one
+    try:
+        with open(os.path.join(store, "index.json")) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"latest": None, "snapshots": {}}
+
+
+def page_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def save_snapshot(store: str, response: requests.Response) -> str:
+    index = load_index(store)
+    fetched = datetime.datetime.now(datetime.timezone.utc)
+    name = f"api-{fetched:%Y%m%dT%H%M%SZ}.html"
+
+    os.makedirs(store, exist_ok=True)
+
+    with open(os.path.join(store, name), "w", encoding="utf-8") as f:
+        f.write(response.text)
+
+    index["latest"] = name
+    index["snapshots"][name] = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "sha256": page_hash(response.text),
+        "fetched": fetched.isoformat()
+    }
+
+    with open(os.path.join(store, "index.json"), "w") as f:
+        json.dump(index, f, indent=4)
+
+    return name
+
+
+def fetch(store: str) -> Optional[str]:
+    """Download the docs, unless they're the same as the latest snapshot.
 
+    The validators of the latest snapshot are sent along, the page is
+    None when the server answers it hasn't changed or sends the same page
+    again.
+    """
+    index = load_index(store)
+    latest = index["snapshots"].get(index["latest"], {})
+    headers = {}
 
-def scrape():
-    response = requests.get(URL)
-    soup = BeautifulSoup(response.text, "html.parser")
-    dev_rules = soup.find("div", {"id": "dev_page_content"})
+    if latest.get("etag"):
+        headers["If-None-Match"] = latest["etag"]
+    if latest.get("last_modified"):
+        headers["If-Modified-Since"] = latest["last_modified"]
 
-    current_name = ""
-    current_type = ""
+    response = requests.get(URL, headers=headers, timeout=TIMEOUT)
+
+    if response.status_code == 304:
+        return None
+
+    response.raise_for_status()
+
+    # Servers ignoring the validators answer with the same page
+    if latest.get("sha256") == page_hash(response.text):
+        return None
+
+    print(f"Saved {save_snapshot(store, response)}")
+
+    return response.text
+
+
+@functools.cache
+def get_features() -> str:
+    # lxml is optional, it builds the same tree several times faster
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+
+    return "lxml"
+
+
+def get_content(text: str) -> str:
+    # Raw HTML of div#dev_page_content, found without parsing the page:
+    # the div ends at the first </div> it doesn't contain the <div> of
+    match = CONTENT.search(text)
+    if match is None:
+        raise ValueError("The page has no div#dev_page_content")
+
+    depth = 0
+
+    for x in DIV.finditer(text, match.end()):
+        if not x.group(1):
+            depth += 1
+        elif depth:
+            depth -= 1
+        else:
+            return text[match.end():x.start()]
+
+    return text[match.end():]
+
+
+def get_sections(content: str) -> list[str]:
+    # Raw HTML of every h4 along with what follows it, up to the next h4
+    # (h3 and hr close a section too)
+    starts = [x.start() for x in BOUNDARY.finditer(content)]
+
+    return [
+        content[x:y] 
+        for x, y in zip(starts, [*starts[1:], len(content)]) 
+        if content[x:x + 3].lower() == "<h4"
+    ]
 
-    for x in dev_rules.children:
-        if x.name == "h3" or x.name == "hr":
-            current_name = ""
-            current_type = ""
 
-        if x.name == "h4":
-            anchor = x.find("a")
+def parse_section(section: str, features: Optional[str] = None) -> Tag:
+    soup = BeautifulSoup(section, features or get_features())
+    # lxml wraps the fragment in <html><body>
+    return soup.body or soup
+
+
+class Scraper:
+    """Scrapes one page of the docs into its own result.
+
+    Scrapers don't share any state, several pages (e.g. the snapshots of
+    different versions) can be scraped in the same process.
+    """
+
+    def __init__(self, verbose: bool = True):
+        self.result = {
+            "types": {},
+            "methods": {}
+        }
+        self.verbose = verbose
+
+    def scrape(self, text: str, previous: Optional[dict] = None) -> dict:
+        """Scrape the docs into the result, return the hash of every section.
+
+        ``previous`` is the api.json and the section hashes of a former run:
+        the sections whose raw HTML didn't change are taken from it as they
+        are, only the others are parsed and extracted again.
+        """
+        hashes = {"types": {}, "methods": {}}
+
+        for section in get_sections(get_content(text)):
+            # Only the heading is parsed to know what the section is about
+            h4 = parse_section(section[:H4_END.search(section).end()]).h4
+            anchor = h4.find("a")
             name = anchor.get("name")
-            current_name = x.get_text()
+            current_name = h4.get_text()
             current_type = "types"
 
             if "-" in name:
-                current_name = ""
-                current_type = ""
                 continue
 
             if not current_name[0].isupper():
                 current_type = "methods"
 
-            print(f"current types/methods: {current_name}")
-            
-            RESULT[current_type][current_name] = {
+            h = hashes[current_type][current_name] = hashlib.sha256(
+                section.encode()
+            ).hexdigest()
+
+            if (
+                previous is not None and 
+                previous["sections"][current_type].get(current_name) == h
+            ):
+                self.result[current_type][current_name] = (
+                    previous["api"][current_type][current_name]
+                )
+                continue
+
+            if self.verbose:
+                print(f"current types/methods: {current_name}")
+
+            self.result[current_type][current_name] = {
                 "name": current_name,
                 "href": f"{URL}#{name}"
             }
-        
-        if not current_name or not current_type:
-            continue
+
+            for x in parse_section(section).h4.next_siblings:
+                self.extract_node(current_type, current_name, x)
+
+        return hashes
+
+    def extract_node(self, current_type: str, current_name: str, x: Tag):
+        entry = self.result[current_type][current_name]
 
         if x.name == "p":
-            RESULT[current_type][current_name].setdefault(
-                "description", 
-                []
-            ).extend(get_description(x))
+            entry.setdefault("description", []).extend(get_description(x))
 
         if x.name == "table":
             tbody = x.find("tbody")
-            fields = RESULT[current_type][current_name]["fields"] = []
+            fields = entry["fields"] = []
 
             for tr in tbody.find_all("tr"):
                 children = list(tr.find_all("td"))
@@ -159,31 +337,269 @@ def scrape():
             subtypes = []
             for li in x.find_all("li"):
                 subtypes.extend(get_description(li))
-            
-            RESULT["types"][current_name]["subtypes"] = subtypes
+
+            entry["subtypes"] = subtypes
 
             for x in subtypes:
-                RESULT["types"][current_name]["description"].append(f"- {x}")
+                entry["description"].append(f"- {x}")
+
+    def add_returns(self, names: Optional[list[str]] = None):
+        # Once the whole description of every method is known
+        methods = self.result["methods"]
+
+        for k in methods if names is None else names:
+            if methods.get(k, {}).get("description"):
+                self.get_return(k)
+
+    def get_return(self, current_name: str):
+        desc = "\n".join(self.result["methods"][current_name]["description"])
+        ret_search = RETURN.search(desc)
+        if ret_search:
+            self.extract_return(current_name, ret_search.group(1))
+        else:
+            self.extract_return(
+                current_name, 
+                RETURN_FALLBACK.search(desc).group(1)
+            )
+
+    def extract_return(self, c: str, t: str):
+        array_match = RETURN_ARRAY.search(t)
+        if array_match:
+            types = get_types_tg(array_match.group(1))
+        else:
+            types = [
+                y 
+                for x in t.split() 
+                for y in get_types_tg(x) 
+                if x[0].isupper()
+            ]
+
+        self.result["methods"][c]["returns"] = types
+
+    def add_subtype_of(self):
+        types = self.result["types"]
+
+        for k, v in types.items():
+            for x in v.get("subtypes", []):
+                types[x].setdefault("subtype_of", []).append(k)
+
+
+def load_sections() -> Optional[dict]:
+    # The api.json of the previous run, if it was scraped by this version
+    # of the scraper, along with its section hashes
+    try:
+        with open(SECTIONS) as f:
+            sections = json.load(f)
+        with open("api.json") as f:
+            api = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if sections.get("version") != SCRAPER_VERSION:
+        return None
+
+    for v in api["types"].values():
+        # Rebuilt from the subtypes after every scrape
+        v.pop("subtype_of", None)
+
+    return {"api": api, "sections": sections}
+
+
+def load_page_hash() -> Optional[str]:
+    # Hash of the page the current api.json was scraped from
+    try:
+        with open(SECTIONS) as f:
+            return json.load(f).get("page")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def get_changed(hashes: dict, previous: Optional[dict]) -> dict:
+    # Sections added, modified or removed since the previous run, all of
+    # them when there's nothing to compare with
+    changed = {}
+
+    for x in ("types", "methods"):
+        old = previous["sections"][x] if previous is not None else {}
+        changed[x] = sorted(
+            k 
+            for k in hashes[x].keys() | old.keys() 
+            if hashes[x].get(k) != old.get(k)
+        )
+
+    return changed
+
+
+def scrape_snapshot(path: str) -> tuple[str, dict]:
+    # Run on a worker process: the version of the page and its api.json
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+
+    scraper = Scraper(verbose=False)
+    scraper.scrape(text)
+    scraper.add_returns()
+    scraper.add_subtype_of()
+    add_type_trees(scraper.result)
+
+    match = VERSION.search(get_content(text))
+    if match is None:
+        # Named after the file instead
+        return os.path.splitext(os.path.basename(path))[0], scraper.result
+
+    return match.group(1), scraper.result
+
+
+def scrape_batch(directory: str, output: str, workers: int) -> dict:
+    """Scrape every saved page of a directory into one api.json per version.
+
+    Pages are taken in the order of their names (the order they were saved
+    in, for a snapshot store), the last page of a version wins.
+    """
+    paths = sorted(
+        os.path.join(directory, x) 
+        for x in os.listdir(directory) 
+        if x.endswith(".html")
+    )
+    versions = {}
+
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(scrape_snapshot, paths))
+    else:
+        results = list(map(scrape_snapshot, paths))
 
-        if (
-            current_type == "methods" and 
-            RESULT["methods"][current_name].get("description")
-        ):
-            get_return(current_name)
+    for path, (version, result) in zip(paths, results):
+        versions[version] = path
+
+        os.makedirs(os.path.join(output, version), exist_ok=True)
+
+        with open(os.path.join(output, version, "api.json"), "w") as f:
+            json.dump(result, f, indent=4)
+
+    return versions
 
 
 def main():
-    print("Starting scrape")
-    scrape()
+    parser = argparse.ArgumentParser(description="Scrape the Bot API docs")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="add the type trees to the existing api.json, without scraping"
+    )
+    parser.add_argument(
+        "--from-file",
+        metavar="PATH",
+        help="scrape a saved page instead of downloading the docs"
+    )
+    parser.add_argument(
+        "--snapshots",
+        default=SNAPSHOTS,
+        metavar="DIR",
+        help="where downloaded pages are saved, along with their ETag and "
+        "Last-Modified (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="scrape the latest snapshot even if the docs haven't changed"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="extract every section again, even the unchanged ones"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="scrape every page saved in DIR (e.g. the snapshots) into "
+        "OUTPUT/<version>/api.json"
+    )
+    parser.add_argument(
+        "--output",
+        default=VERSIONS,
+        help="where --batch writes the api.json of every version "
+        "(default: %(default)s)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes for --batch, 0 uses every core"
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        workers = args.jobs or os.cpu_count() or 1
+        versions = scrape_batch(args.batch, args.output, workers)
 
-    for k, v in RESULT["types"].items():
-        for x in v.get("subtypes", []):
-            RESULT["types"][x].setdefault("subtype_of", []).append(k)
+        for version, path in versions.items():
+            print(f"{version}: {path}")
+
+        print(f"Total versions: {len(versions)}")
+        return
+
+    scraper = Scraper()
+
+    if args.update:
+        with open("api.json") as f:
+            scraper.result.update(json.load(f))
+    else:
+        if args.from_file:
+            with open(args.from_file, encoding="utf-8") as f:
+                text = f.read()
+        else:
+            text = fetch(args.snapshots)
+
+        if text is None:
+            # Same docs as the latest snapshot, which may not be the page
+            # api.json was scraped from (e.g. after --from-file)
+            index = load_index(args.snapshots)
+            path = os.path.join(args.snapshots, index["latest"])
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+
+            if not args.force and load_page_hash() == page_hash(text):
+                print("Not modified, nothing to do")
+                return
+
+        previous = None if args.full else load_sections()
+
+        print("Starting scrape")
+        hashes = scraper.scrape(text, previous)
+        changed = get_changed(hashes, previous)
+        scraper.add_returns(changed["methods"])
+        scraper.add_subtype_of()
+
+        with open(SECTIONS, "w") as f:
+            json.dump(
+                {
+                    "version": SCRAPER_VERSION, 
+                    "page": page_hash(text), 
+                    **hashes
+                }, 
+                f, 
+                indent=4
+            )
+
+        print(
+            f"Changed: {len(changed['types'])} types, "
+            f"{len(changed['methods'])} methods"
+        )
+
+        # Only reported, build_types.py finds the modules to rebuild
+        # through the hashes of the types
+        if previous is not None:
+            for x in ("types", "methods"):
+                if changed[x]:
+                    print(f"Changed {x}: {', '.join(changed[x])}")
+
+    add_type_trees(scraper.result)
 
     with open("api.json", "w") as f:
-        json.dump(RESULT, f, indent=4)
+        json.dump(scraper.result, f, indent=4)
 
-    print(f"Total types: {len(RESULT['types'])}")    
+    print(f"Total types: {len(scraper.result['types'])}")    
     print("Finish")
 
 
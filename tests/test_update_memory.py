@@ -0,0 +1,80 @@
+"""Memory held by the updates of the corpus, for several builds.
+
+Every build is generated into a temporary pybotgram package and measured
+in a fresh interpreter, with ``benchmarks/update_memory.py``:
+
+    python -m pytest tests
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+BENCHMARKS = os.path.join(ROOT, "benchmarks")
+CORPUS = os.path.join(BENCHMARKS, "updates.json")
+ROUNDS = 200
+
+
+def build(directory: str, *flags: str) -> str:
+    # build_types works in the current directory, so a copy of the
+    # generator is run and the types of the repository are left alone
+    work = os.path.join(directory, "build")
+    shutil.copytree(
+        os.path.join(ROOT, "templates"),
+        os.path.join(work, "templates")
+    )
+    for x in ("build_types.py", "api_ir.py", "api.json"):
+        shutil.copy(os.path.join(ROOT, x), work)
+    os.mkdir(os.path.join(work, "types"))
+
+    # Formatting doesn't change what the modules do
+    subprocess.run(
+        [sys.executable, "build_types.py", "--no-format", *flags],
+        cwd=work,
+        capture_output=True,
+        check=True
+    )
+
+    package = os.path.join(directory, "pybotgram")
+    shutil.copytree(
+        os.path.join(work, "types"),
+        os.path.join(package, "types")
+    )
+    open(os.path.join(package, "__init__.py"), "w").close()
+
+    # The Object base of pybotgram, only written by --slots builds
+    base = os.path.join(package, "types", "object.py")
+    if not os.path.exists(base):
+        shutil.copy(os.path.join(ROOT, "templates", "object.txt"), base)
+
+    return directory
+
+
+def measure(directory: str) -> int:
+    code = (
+        "import json\n"
+        "import sys\n"
+        f"sys.path[:0] = [{directory!r}, {BENCHMARKS!r}]\n"
+        "import update_memory\n"
+        f"with open({CORPUS!r}) as f:\n"
+        "    updates = json.load(f)\n"
+        f"print(update_memory.measure(updates, {ROUNDS})[0])\n"
+    )
+
+    return int(subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=directory,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout)
+
+
+def test_class_defaults(tmp_path):
+    default = measure(build(str(tmp_path / "default")))
+    class_defaults = measure(
+        build(str(tmp_path / "class_defaults"), "--class-defaults")
+    )
+
+    assert class_defaults < default
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 __all__ = (
     "Update",
     "WebhookInfo",
@@ -42,17 +46,69 @@ __all__ = (
     "ChatPhoto",
     "ChatInviteLink",
     "ChatAdministratorRights",
+    "ChatMember",
+    "ChatMemberOwner",
+    "ChatMemberAdministrator",
+    "ChatMemberMember",
+    "ChatMemberRestricted",
+    "ChatMemberLeft",
+    "ChatMemberBanned",
     "ChatMemberUpdated",
     "ChatJoinRequest",
     "ChatPermissions",
     "ChatLocation",
     "BotCommand",
+    "BotCommandScope",
+    "BotCommandScopeDefault",
+    "BotCommandScopeAllPrivateChats",
+    "BotCommandScopeAllGroupChats",
+    "BotCommandScopeAllChatAdministrators",
+    "BotCommandScopeChat",
+    "BotCommandScopeChatAdministrators",
+    "BotCommandScopeChatMember",
+    "MenuButton",
+    "MenuButtonCommands",
+    "MenuButtonWebApp",
+    "MenuButtonDefault",
     "ResponseParameters",
+    "InputMedia",
+    "InputMediaAnimation",
+    "InputMediaDocument",
+    "InputMediaAudio",
+    "InputMediaPhoto",
+    "InputMediaVideo",
     "InputFile",
     "Sticker",
     "StickerSet",
     "MaskPosition",
     "InlineQuery",
+    "InlineQueryResult",
+    "InlineQueryResultCachedAudio",
+    "InlineQueryResultCachedDocument",
+    "InlineQueryResultCachedGif",
+    "InlineQueryResultCachedMpeg4Gif",
+    "InlineQueryResultCachedPhoto",
+    "InlineQueryResultCachedSticker",
+    "InlineQueryResultCachedVideo",
+    "InlineQueryResultCachedVoice",
+    "InlineQueryResultArticle",
+    "InlineQueryResultAudio",
+    "InlineQueryResultContact",
+    "InlineQueryResultGame",
+    "InlineQueryResultDocument",
+    "InlineQueryResultGif",
+    "InlineQueryResultLocation",
+    "InlineQueryResultMpeg4Gif",
+    "InlineQueryResultPhoto",
+    "InlineQueryResultVenue",
+    "InlineQueryResultVideo",
+    "InlineQueryResultVoice",
+    "InputMessageContent",
+    "InputTextMessageContent",
+    "InputLocationMessageContent",
+    "InputVenueMessageContent",
+    "InputContactMessageContent",
+    "InputInvoiceMessageContent",
     "ChosenInlineResult",
     "SentWebAppMessage",
     "LabeledPrice",
@@ -67,80 +123,311 @@ __all__ = (
     "PassportFile",
     "EncryptedPassportElement",
     "EncryptedCredentials",
+    "PassportElementError",
+    "PassportElementErrorDataField",
+    "PassportElementErrorFrontSide",
+    "PassportElementErrorReverseSide",
+    "PassportElementErrorSelfie",
+    "PassportElementErrorFile",
+    "PassportElementErrorFiles",
+    "PassportElementErrorTranslationFile",
+    "PassportElementErrorTranslationFiles",
+    "PassportElementErrorUnspecified",
     "Game",
     "CallbackGame",
     "GameHighScore",
 )
 
+# Type name -> module defining it, imported the first time the type is used
+_MODULES = {
+    "Update": "update",
+    "WebhookInfo": "webhook_info",
+    "User": "user",
+    "Chat": "chat",
+    "Message": "message",
+    "MessageId": "message_id",
+    "MessageEntity": "message_entity",
+    "PhotoSize": "photo_size",
+    "Animation": "animation",
+    "Audio": "audio",
+    "Document": "document",
+    "Video": "video",
+    "VideoNote": "video_note",
+    "Voice": "voice",
+    "Contact": "contact",
+    "Dice": "dice",
+    "PollOption": "poll_option",
+    "PollAnswer": "poll_answer",
+    "Poll": "poll",
+    "Location": "location",
+    "Venue": "venue",
+    "WebAppData": "web_app_data",
+    "ProximityAlertTriggered": "proximity_alert_triggered",
+    "MessageAutoDeleteTimerChanged": "message_auto_delete_timer_changed",
+    "VideoChatScheduled": "video_chat_scheduled",
+    "VideoChatStarted": "video_chat_started",
+    "VideoChatEnded": "video_chat_ended",
+    "VideoChatParticipantsInvited": "video_chat_participants_invited",
+    "UserProfilePhotos": "user_profile_photos",
+    "File": "file",
+    "WebAppInfo": "web_app_info",
+    "ReplyKeyboardMarkup": "reply_keyboard_markup",
+    "KeyboardButton": "keyboard_button",
+    "KeyboardButtonPollType": "keyboard_button_poll_type",
+    "ReplyKeyboardRemove": "reply_keyboard_remove",
+    "InlineKeyboardMarkup": "inline_keyboard_markup",
+    "InlineKeyboardButton": "inline_keyboard_button",
+    "LoginUrl": "login_url",
+    "CallbackQuery": "callback_query",
+    "ForceReply": "force_reply",
+    "ChatPhoto": "chat_photo",
+    "ChatInviteLink": "chat_invite_link",
+    "ChatAdministratorRights": "chat_administrator_rights",
+    "ChatMember": "chat_member",
+    "ChatMemberOwner": "chat_member",
+    "ChatMemberAdministrator": "chat_member",
+    "ChatMemberMember": "chat_member",
+    "ChatMemberRestricted": "chat_member",
+    "ChatMemberLeft": "chat_member",
+    "ChatMemberBanned": "chat_member",
+    "ChatMemberUpdated": "chat_member_updated",
+    "ChatJoinRequest": "chat_join_request",
+    "ChatPermissions": "chat_permissions",
+    "ChatLocation": "chat_location",
+    "BotCommand": "bot_command",
+    "BotCommandScope": "bot_command_scope",
+    "BotCommandScopeDefault": "bot_command_scope",
+    "BotCommandScopeAllPrivateChats": "bot_command_scope",
+    "BotCommandScopeAllGroupChats": "bot_command_scope",
+    "BotCommandScopeAllChatAdministrators": "bot_command_scope",
+    "BotCommandScopeChat": "bot_command_scope",
+    "BotCommandScopeChatAdministrators": "bot_command_scope",
+    "BotCommandScopeChatMember": "bot_command_scope",
+    "MenuButton": "menu_button",
+    "MenuButtonCommands": "menu_button",
+    "MenuButtonWebApp": "menu_button",
+    "MenuButtonDefault": "menu_button",
+    "ResponseParameters": "response_parameters",
+    "InputMedia": "input_media",
+    "InputMediaAnimation": "input_media",
+    "InputMediaDocument": "input_media",
+    "InputMediaAudio": "input_media",
+    "InputMediaPhoto": "input_media",
+    "InputMediaVideo": "input_media",
+    "InputFile": "input_file",
+    "Sticker": "sticker",
+    "StickerSet": "sticker_set",
+    "MaskPosition": "mask_position",
+    "InlineQuery": "inline_query",
+    "InlineQueryResult": "inline_query_result",
+    "InlineQueryResultCachedAudio": "inline_query_result",
+    "InlineQueryResultCachedDocument": "inline_query_result",
+    "InlineQueryResultCachedGif": "inline_query_result",
+    "InlineQueryResultCachedMpeg4Gif": "inline_query_result",
+    "InlineQueryResultCachedPhoto": "inline_query_result",
+    "InlineQueryResultCachedSticker": "inline_query_result",
+    "InlineQueryResultCachedVideo": "inline_query_result",
+    "InlineQueryResultCachedVoice": "inline_query_result",
+    "InlineQueryResultArticle": "inline_query_result",
+    "InlineQueryResultAudio": "inline_query_result",
+    "InlineQueryResultContact": "inline_query_result",
+    "InlineQueryResultGame": "inline_query_result",
+    "InlineQueryResultDocument": "inline_query_result",
+    "InlineQueryResultGif": "inline_query_result",
+    "InlineQueryResultLocation": "inline_query_result",
+    "InlineQueryResultMpeg4Gif": "inline_query_result",
+    "InlineQueryResultPhoto": "inline_query_result",
+    "InlineQueryResultVenue": "inline_query_result",
+    "InlineQueryResultVideo": "inline_query_result",
+    "InlineQueryResultVoice": "inline_query_result",
+    "InputMessageContent": "input_message_content",
+    "InputTextMessageContent": "input_message_content",
+    "InputLocationMessageContent": "input_message_content",
+    "InputVenueMessageContent": "input_message_content",
+    "InputContactMessageContent": "input_message_content",
+    "InputInvoiceMessageContent": "input_message_content",
+    "ChosenInlineResult": "chosen_inline_result",
+    "SentWebAppMessage": "sent_web_app_message",
+    "LabeledPrice": "labeled_price",
+    "Invoice": "invoice",
+    "ShippingAddress": "shipping_address",
+    "OrderInfo": "order_info",
+    "ShippingOption": "shipping_option",
+    "SuccessfulPayment": "successful_payment",
+    "ShippingQuery": "shipping_query",
+    "PreCheckoutQuery": "pre_checkout_query",
+    "PassportData": "passport_data",
+    "PassportFile": "passport_file",
+    "EncryptedPassportElement": "encrypted_passport_element",
+    "EncryptedCredentials": "encrypted_credentials",
+    "PassportElementError": "passport_element_error",
+    "PassportElementErrorDataField": "passport_element_error",
+    "PassportElementErrorFrontSide": "passport_element_error",
+    "PassportElementErrorReverseSide": "passport_element_error",
+    "PassportElementErrorSelfie": "passport_element_error",
+    "PassportElementErrorFile": "passport_element_error",
+    "PassportElementErrorFiles": "passport_element_error",
+    "PassportElementErrorTranslationFile": "passport_element_error",
+    "PassportElementErrorTranslationFiles": "passport_element_error",
+    "PassportElementErrorUnspecified": "passport_element_error",
+    "Game": "game",
+    "CallbackGame": "callback_game",
+    "GameHighScore": "game_high_score",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Same as "from .module import name", unlike importlib.import_module
+    # it goes through the regular import machinery (and -X importtime)
+    value = getattr(__import__(module, globals(), None, (name,), 1), name)
+    # Later lookups find it in the module namespace, skipping __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:
+    from typing import Any, List
 
-from .update import Update
-from .webhook_info import WebhookInfo
-from .user import User
-from .chat import Chat
-from .message import Message
-from .message_id import MessageId
-from .message_entity import MessageEntity
-from .photo_size import PhotoSize
-from .animation import Animation
-from .audio import Audio
-from .document import Document
-from .video import Video
-from .video_note import VideoNote
-from .voice import Voice
-from .contact import Contact
-from .dice import Dice
-from .poll_option import PollOption
-from .poll_answer import PollAnswer
-from .poll import Poll
-from .location import Location
-from .venue import Venue
-from .web_app_data import WebAppData
-from .proximity_alert_triggered import ProximityAlertTriggered
-from .message_auto_delete_timer_changed import MessageAutoDeleteTimerChanged
-from .video_chat_scheduled import VideoChatScheduled
-from .video_chat_started import VideoChatStarted
-from .video_chat_ended import VideoChatEnded
-from .video_chat_participants_invited import VideoChatParticipantsInvited
-from .user_profile_photos import UserProfilePhotos
-from .file import File
-from .web_app_info import WebAppInfo
-from .reply_keyboard_markup import ReplyKeyboardMarkup
-from .keyboard_button import KeyboardButton
-from .keyboard_button_poll_type import KeyboardButtonPollType
-from .reply_keyboard_remove import ReplyKeyboardRemove
-from .inline_keyboard_markup import InlineKeyboardMarkup
-from .inline_keyboard_button import InlineKeyboardButton
-from .login_url import LoginUrl
-from .callback_query import CallbackQuery
-from .force_reply import ForceReply
-from .chat_photo import ChatPhoto
-from .chat_invite_link import ChatInviteLink
-from .chat_administrator_rights import ChatAdministratorRights
-from .chat_member_updated import ChatMemberUpdated
-from .chat_join_request import ChatJoinRequest
-from .chat_permissions import ChatPermissions
-from .chat_location import ChatLocation
-from .bot_command import BotCommand
-from .response_parameters import ResponseParameters
-from .input_file import InputFile
-from .sticker import Sticker
-from .sticker_set import StickerSet
-from .mask_position import MaskPosition
-from .inline_query import InlineQuery
-from .chosen_inline_result import ChosenInlineResult
-from .sent_web_app_message import SentWebAppMessage
-from .labeled_price import LabeledPrice
-from .invoice import Invoice
-from .shipping_address import ShippingAddress
-from .order_info import OrderInfo
-from .shipping_option import ShippingOption
-from .successful_payment import SuccessfulPayment
-from .shipping_query import ShippingQuery
-from .pre_checkout_query import PreCheckoutQuery
-from .passport_data import PassportData
-from .passport_file import PassportFile
-from .encrypted_passport_element import EncryptedPassportElement
-from .encrypted_credentials import EncryptedCredentials
-from .game import Game
-from .callback_game import CallbackGame
-from .game_high_score import GameHighScore
+    from .update import Update
+    from .webhook_info import WebhookInfo
+    from .user import User
+    from .chat import Chat
+    from .message import Message
+    from .message_id import MessageId
+    from .message_entity import MessageEntity
+    from .photo_size import PhotoSize
+    from .animation import Animation
+    from .audio import Audio
+    from .document import Document
+    from .video import Video
+    from .video_note import VideoNote
+    from .voice import Voice
+    from .contact import Contact
+    from .dice import Dice
+    from .poll_option import PollOption
+    from .poll_answer import PollAnswer
+    from .poll import Poll
+    from .location import Location
+    from .venue import Venue
+    from .web_app_data import WebAppData
+    from .proximity_alert_triggered import ProximityAlertTriggered
+    from .message_auto_delete_timer_changed import (
+        MessageAutoDeleteTimerChanged,
+    )
+    from .video_chat_scheduled import VideoChatScheduled
+    from .video_chat_started import VideoChatStarted
+    from .video_chat_ended import VideoChatEnded
+    from .video_chat_participants_invited import VideoChatParticipantsInvited
+    from .user_profile_photos import UserProfilePhotos
+    from .file import File
+    from .web_app_info import WebAppInfo
+    from .reply_keyboard_markup import ReplyKeyboardMarkup
+    from .keyboard_button import KeyboardButton
+    from .keyboard_button_poll_type import KeyboardButtonPollType
+    from .reply_keyboard_remove import ReplyKeyboardRemove
+    from .inline_keyboard_markup import InlineKeyboardMarkup
+    from .inline_keyboard_button import InlineKeyboardButton
+    from .login_url import LoginUrl
+    from .callback_query import CallbackQuery
+    from .force_reply import ForceReply
+    from .chat_photo import ChatPhoto
+    from .chat_invite_link import ChatInviteLink
+    from .chat_administrator_rights import ChatAdministratorRights
+    from .chat_member import ChatMember
+    from .chat_member import ChatMemberOwner
+    from .chat_member import ChatMemberAdministrator
+    from .chat_member import ChatMemberMember
+    from .chat_member import ChatMemberRestricted
+    from .chat_member import ChatMemberLeft
+    from .chat_member import ChatMemberBanned
+    from .chat_member_updated import ChatMemberUpdated
+    from .chat_join_request import ChatJoinRequest
+    from .chat_permissions import ChatPermissions
+    from .chat_location import ChatLocation
+    from .bot_command import BotCommand
+    from .bot_command_scope import BotCommandScope
+    from .bot_command_scope import BotCommandScopeDefault
+    from .bot_command_scope import BotCommandScopeAllPrivateChats
+    from .bot_command_scope import BotCommandScopeAllGroupChats
+    from .bot_command_scope import BotCommandScopeAllChatAdministrators
+    from .bot_command_scope import BotCommandScopeChat
+    from .bot_command_scope import BotCommandScopeChatAdministrators
+    from .bot_command_scope import BotCommandScopeChatMember
+    from .menu_button import MenuButton
+    from .menu_button import MenuButtonCommands
+    from .menu_button import MenuButtonWebApp
+    from .menu_button import MenuButtonDefault
+    from .response_parameters import ResponseParameters
+    from .input_media import InputMedia
+    from .input_media import InputMediaAnimation
+    from .input_media import InputMediaDocument
+    from .input_media import InputMediaAudio
+    from .input_media import InputMediaPhoto
+    from .input_media import InputMediaVideo
+    from .input_file import InputFile
+    from .sticker import Sticker
+    from .sticker_set import StickerSet
+    from .mask_position import MaskPosition
+    from .inline_query import InlineQuery
+    from .inline_query_result import InlineQueryResult
+    from .inline_query_result import InlineQueryResultCachedAudio
+    from .inline_query_result import InlineQueryResultCachedDocument
+    from .inline_query_result import InlineQueryResultCachedGif
+    from .inline_query_result import InlineQueryResultCachedMpeg4Gif
+    from .inline_query_result import InlineQueryResultCachedPhoto
+    from .inline_query_result import InlineQueryResultCachedSticker
+    from .inline_query_result import InlineQueryResultCachedVideo
+    from .inline_query_result import InlineQueryResultCachedVoice
+    from .inline_query_result import InlineQueryResultArticle
+    from .inline_query_result import InlineQueryResultAudio
+    from .inline_query_result import InlineQueryResultContact
+    from .inline_query_result import InlineQueryResultGame
+    from .inline_query_result import InlineQueryResultDocument
+    from .inline_query_result import InlineQueryResultGif
+    from .inline_query_result import InlineQueryResultLocation
+    from .inline_query_result import InlineQueryResultMpeg4Gif
+    from .inline_query_result import InlineQueryResultPhoto
+    from .inline_query_result import InlineQueryResultVenue
+    from .inline_query_result import InlineQueryResultVideo
+    from .inline_query_result import InlineQueryResultVoice
+    from .input_message_content import InputMessageContent
+    from .input_message_content import InputTextMessageContent
+    from .input_message_content import InputLocationMessageContent
+    from .input_message_content import InputVenueMessageContent
+    from .input_message_content import InputContactMessageContent
+    from .input_message_content import InputInvoiceMessageContent
+    from .chosen_inline_result import ChosenInlineResult
+    from .sent_web_app_message import SentWebAppMessage
+    from .labeled_price import LabeledPrice
+    from .invoice import Invoice
+    from .shipping_address import ShippingAddress
+    from .order_info import OrderInfo
+    from .shipping_option import ShippingOption
+    from .successful_payment import SuccessfulPayment
+    from .shipping_query import ShippingQuery
+    from .pre_checkout_query import PreCheckoutQuery
+    from .passport_data import PassportData
+    from .passport_file import PassportFile
+    from .encrypted_passport_element import EncryptedPassportElement
+    from .encrypted_credentials import EncryptedCredentials
+    from .passport_element_error import PassportElementError
+    from .passport_element_error import PassportElementErrorDataField
+    from .passport_element_error import PassportElementErrorFrontSide
+    from .passport_element_error import PassportElementErrorReverseSide
+    from .passport_element_error import PassportElementErrorSelfie
+    from .passport_element_error import PassportElementErrorFile
+    from .passport_element_error import PassportElementErrorFiles
+    from .passport_element_error import PassportElementErrorTranslationFile
+    from .passport_element_error import PassportElementErrorTranslationFiles
+    from .passport_element_error import PassportElementErrorUnspecified
+    from .game import Game
+    from .callback_game import CallbackGame
+    from .game_high_score import GameHighScore
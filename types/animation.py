@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Animation(Object):
     """This object represents an animation file (GIF or H.264/MPEG-4 AVC
@@ -57,7 +63,7 @@ class Animation(Object):
         file_name: Optional[str] = None,
         mime_type: Optional[str] = None,
         file_size: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Audio(Object):
     """This object represents an audio file to be treated as music by the
@@ -59,7 +65,7 @@ class Audio(Object):
         mime_type: Optional[str] = None,
         file_size: Optional[int] = None,
         thumb: Optional["types.PhotoSize"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
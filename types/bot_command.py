@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class BotCommand(Object):
     """This object represents a bot command.
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class CallbackGame(Object):
     """A placeholder, currently holds no information. Use BotFather to set up
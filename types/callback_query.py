@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class CallbackQuery(Object):
     """This object represents an incoming callback query from a callback
@@ -55,7 +61,7 @@ class CallbackQuery(Object):
         chat_instance: str,
         data: Optional[str] = None,
         game_short_name: Optional[str] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
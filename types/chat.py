@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Chat(Object):
     """This object represents a chat.
@@ -133,7 +139,7 @@ class Chat(Object):
         can_set_sticker_set: Optional[bool] = None,
         linked_chat_id: Optional[int] = None,
         location: Optional["types.ChatLocation"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChatAdministratorRights(Object):
     """Represents the rights of an administrator in a chat.
@@ -71,7 +77,7 @@ class ChatAdministratorRights(Object):
         can_post_messages: Optional[bool] = None,
         can_edit_messages: Optional[bool] = None,
         can_pin_messages: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
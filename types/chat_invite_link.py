@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChatInviteLink(Object):
     """Represents an invite link for a chat.
@@ -55,7 +61,7 @@ class ChatInviteLink(Object):
         expire_date: Optional[int] = None,
         member_limit: Optional[int] = None,
         pending_join_request_count: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChatJoinRequest(Object):
     """Represents a join request sent to a chat.
@@ -34,7 +40,7 @@ class ChatJoinRequest(Object):
         date: int,
         bio: Optional[str] = None,
         invite_link: Optional["types.ChatInviteLink"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
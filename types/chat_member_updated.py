@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChatMemberUpdated(Object):
     """This object represents changes in the status of a chat member.
@@ -38,7 +44,7 @@ class ChatMemberUpdated(Object):
         old_chat_member: "types.ChatMember",
         new_chat_member: "types.ChatMember",
         invite_link: Optional["types.ChatInviteLink"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
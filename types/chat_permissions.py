@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChatPermissions(Object):
     """Describes actions that a non-administrator user is allowed to take in
@@ -55,7 +61,7 @@ class ChatPermissions(Object):
         can_change_info: Optional[bool] = None,
         can_invite_users: Optional[bool] = None,
         can_pin_messages: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChatPhoto(Object):
     """This object represents a chat photo.
@@ -37,7 +43,7 @@ class ChatPhoto(Object):
         small_file_unique_id: str,
         big_file_id: str,
         big_file_unique_id: str,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ChosenInlineResult(Object):
     """Represents a result of an inline query that was chosen by the user and
@@ -39,7 +45,7 @@ class ChosenInlineResult(Object):
         location: Optional["types.Location"] = None,
         inline_message_id: Optional[str] = None,
         query: str,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
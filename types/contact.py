@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Contact(Object):
     """This object represents a phone contact.
@@ -37,7 +43,7 @@ class Contact(Object):
         last_name: Optional[str] = None,
         user_id: Optional[int] = None,
         vcard: Optional[str] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Document(Object):
     """This object represents a general file (as opposed to photos, voice
@@ -45,7 +51,7 @@ class Document(Object):
         file_name: Optional[str] = None,
         mime_type: Optional[str] = None,
         file_size: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class EncryptedPassportElement(Object):
     """Describes documents or other Telegram Passport elements shared with
@@ -86,7 +92,7 @@ class EncryptedPassportElement(Object):
         selfie: Optional["types.PassportFile"] = None,
         translation: Optional[List["types.PassportFile"]] = None,
         hash: str,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
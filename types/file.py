@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class File(Object):
     """This object represents a file ready to be downloaded. The file can be
@@ -41,7 +47,7 @@ class File(Object):
         file_unique_id: str,
         file_size: Optional[int] = None,
         file_path: Optional[str] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
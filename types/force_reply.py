@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ForceReply(Object):
     """Upon receiving a message with this object, Telegram clients will
@@ -34,7 +40,7 @@ class ForceReply(Object):
         force_reply: bool,
         input_field_placeholder: Optional[str] = None,
         selective: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
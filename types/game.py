@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class Game(Object):
     """This object represents a game. Use BotFather to create and edit games,
@@ -45,7 +51,7 @@ class Game(Object):
         text: Optional[str] = None,
         text_entities: Optional[List["types.MessageEntity"]] = None,
         animation: Optional["types.Animation"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class InlineKeyboardButton(Object):
     """This object represents one button of an inline keyboard. You must use
@@ -78,7 +84,7 @@ class InlineKeyboardButton(Object):
         switch_inline_query_current_chat: Optional[str] = None,
         callback_game: Optional["types.CallbackGame"] = None,
         pay: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,26 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
+
+def _parse_inline_keyboard_button_list_list(
+    data: Any, bot: "pybotgram.Bot"
+) -> Optional[List[List["types.InlineKeyboardButton"]]]:
+    if not isinstance(data, list):
+        return None
+
+    # The element parser is looked up once, not once per element
+    parse = types.InlineKeyboardButton._parse
+    return [[parse(x0, bot) for x0 in x1] for x1 in data]
+
 
 class InlineKeyboardMarkup(Object):
     """This object represents an inline keyboard that appears right next to
@@ -21,7 +38,7 @@ class InlineKeyboardMarkup(Object):
         self,
         *,
         inline_keyboard: List[List["types.InlineKeyboardButton"]],
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -36,7 +53,7 @@ class InlineKeyboardMarkup(Object):
 
         data = data.copy()
 
-        data["inline_keyboard"] = types.InlineKeyboardButton._parse_list(
+        data["inline_keyboard"] = _parse_inline_keyboard_button_list_list(
             data.get("inline_keyboard"), bot
         )
 
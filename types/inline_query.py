@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class InlineQuery(Object):
     """This object represents an incoming inline query. When the user sends
@@ -45,7 +51,7 @@ class InlineQuery(Object):
         offset: str,
         chat_type: Optional[str] = None,
         location: Optional["types.Location"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
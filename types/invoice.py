@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Invoice(Object):
     """This object contains basic information about an invoice.
@@ -38,7 +44,7 @@ class Invoice(Object):
         start_parameter: str,
         currency: str,
         total_amount: int,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
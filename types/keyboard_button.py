@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class KeyboardButton(Object):
     """This object represents one button of the reply keyboard. For simple
@@ -55,7 +61,7 @@ class KeyboardButton(Object):
         request_location: Optional[bool] = None,
         request_poll: Optional["types.KeyboardButtonPollType"] = None,
         web_app: Optional["types.WebAppInfo"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
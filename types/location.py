@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Location(Object):
     """This object represents a point on the map.
@@ -42,7 +48,7 @@ class Location(Object):
         live_period: Optional[int] = None,
         heading: Optional[int] = None,
         proximity_alert_radius: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class LoginUrl(Object):
     """This object represents a parameter of the inline keyboard button used
@@ -47,7 +53,7 @@ class LoginUrl(Object):
         forward_text: Optional[str] = None,
         bot_username: Optional[str] = None,
         request_write_access: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class MaskPosition(Object):
     """This object describes the position on faces where a mask should be
@@ -36,7 +42,7 @@ class MaskPosition(Object):
         x_shift: float,
         y_shift: float,
         scale: float,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
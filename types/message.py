@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class Message(Object):
     """This object represents a message.
@@ -321,7 +327,7 @@ class Message(Object):
         ] = None,
         web_app_data: Optional["types.WebAppData"] = None,
         reply_markup: Optional["types.InlineKeyboardMarkup"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -438,10 +444,10 @@ class Message(Object):
         data["new_chat_photo"] = types.PhotoSize._parse_list(
             data.get("new_chat_photo"), bot
         )
-        data[
-            "message_auto_delete_timer_changed"
-        ] = types.MessageAutoDeleteTimerChanged._parse(
-            data.get("message_auto_delete_timer_changed"), bot
+        data["message_auto_delete_timer_changed"] = (
+            types.MessageAutoDeleteTimerChanged._parse(
+                data.get("message_auto_delete_timer_changed"), bot
+            )
         )
         data["pinned_message"] = types.Message._parse(
             data.get("pinned_message"), bot
@@ -453,10 +459,10 @@ class Message(Object):
         data["passport_data"] = types.PassportData._parse(
             data.get("passport_data"), bot
         )
-        data[
-            "proximity_alert_triggered"
-        ] = types.ProximityAlertTriggered._parse(
-            data.get("proximity_alert_triggered"), bot
+        data["proximity_alert_triggered"] = (
+            types.ProximityAlertTriggered._parse(
+                data.get("proximity_alert_triggered"), bot
+            )
         )
         data["video_chat_scheduled"] = types.VideoChatScheduled._parse(
             data.get("video_chat_scheduled"), bot
@@ -467,10 +473,10 @@ class Message(Object):
         data["video_chat_ended"] = types.VideoChatEnded._parse(
             data.get("video_chat_ended"), bot
         )
-        data[
-            "video_chat_participants_invited"
-        ] = types.VideoChatParticipantsInvited._parse(
-            data.get("video_chat_participants_invited"), bot
+        data["video_chat_participants_invited"] = (
+            types.VideoChatParticipantsInvited._parse(
+                data.get("video_chat_participants_invited"), bot
+            )
         )
         data["web_app_data"] = types.WebAppData._parse(
             data.get("web_app_data"), bot
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class MessageEntity(Object):
     """This object represents one special entity in a text message. For
@@ -49,7 +55,7 @@ class MessageEntity(Object):
         url: Optional[str] = None,
         user: Optional["types.User"] = None,
         language: Optional[str] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
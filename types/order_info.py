@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class OrderInfo(Object):
     """This object represents information about an order.
@@ -29,7 +35,7 @@ class OrderInfo(Object):
         phone_number: Optional[str] = None,
         email: Optional[str] = None,
         shipping_address: Optional["types.ShippingAddress"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
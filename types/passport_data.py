@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class PassportData(Object):
     """Describes Telegram Passport data shared with the bot by the user.
@@ -22,7 +28,7 @@ class PassportData(Object):
         *,
         data: List["types.EncryptedPassportElement"],
         credentials: "types.EncryptedCredentials",
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class PassportFile(Object):
     """This object represents a file uploaded to Telegram Passport. Currently
@@ -33,7 +39,7 @@ class PassportFile(Object):
         file_unique_id: str,
         file_size: int,
         file_date: int,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
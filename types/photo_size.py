@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class PhotoSize(Object):
     """This object represents one size of a photo or a file / sticker
@@ -36,7 +42,7 @@ class PhotoSize(Object):
         width: int,
         height: int,
         file_size: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
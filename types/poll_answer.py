@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class PollAnswer(Object):
     """This object represents an answer of a user in a non-anonymous poll.
@@ -26,7 +32,7 @@ class PollAnswer(Object):
         poll_id: str,
         user: "types.User",
         option_ids: List[int],
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
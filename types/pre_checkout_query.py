@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class PreCheckoutQuery(Object):
     """This object contains information about an incoming pre-checkout query.
@@ -46,7 +52,7 @@ class PreCheckoutQuery(Object):
         invoice_payload: str,
         shipping_option_id: Optional[str] = None,
         order_info: Optional["types.OrderInfo"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ProximityAlertTriggered(Object):
     """This object represents the content of a service message, sent whenever
@@ -26,7 +32,7 @@ class ProximityAlertTriggered(Object):
         traveler: "types.User",
         watcher: "types.User",
         distance: int,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,26 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
+
+def _parse_keyboard_button_list_list(
+    data: Any, bot: "pybotgram.Bot"
+) -> Optional[List[List["types.KeyboardButton"]]]:
+    if not isinstance(data, list):
+        return None
+
+    # The element parser is looked up once, not once per element
+    parse = types.KeyboardButton._parse
+    return [[parse(x0, bot) for x0 in x1] for x1 in data]
+
 
 class ReplyKeyboardMarkup(Object):
     """This object represents a custom keyboard with reply options (see
@@ -52,7 +69,7 @@ class ReplyKeyboardMarkup(Object):
         one_time_keyboard: Optional[bool] = None,
         input_field_placeholder: Optional[str] = None,
         selective: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -71,7 +88,7 @@ class ReplyKeyboardMarkup(Object):
 
         data = data.copy()
 
-        data["keyboard"] = types.KeyboardButton._parse_list(
+        data["keyboard"] = _parse_keyboard_button_list_list(
             data.get("keyboard"), bot
         )
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ReplyKeyboardRemove(Object):
     """Upon receiving a message with this object, Telegram clients will
@@ -36,7 +42,7 @@ class ReplyKeyboardRemove(Object):
         *,
         remove_keyboard: bool,
         selective: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
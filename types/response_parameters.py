@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ResponseParameters(Object):
     """Describes why a request was unsuccessful.
@@ -27,7 +33,7 @@ class ResponseParameters(Object):
         *,
         migrate_to_chat_id: Optional[int] = None,
         retry_after: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ShippingAddress(Object):
     """This object represents a shipping address.
@@ -36,7 +42,7 @@ class ShippingAddress(Object):
         street_line1: str,
         street_line2: str,
         post_code: str,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
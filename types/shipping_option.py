@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class ShippingOption(Object):
     """This object represents one shipping option.
@@ -25,7 +31,7 @@ class ShippingOption(Object):
         id: str,
         title: str,
         prices: List["types.LabeledPrice"],
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class ShippingQuery(Object):
     """This object contains information about an incoming shipping query.
@@ -29,7 +35,7 @@ class ShippingQuery(Object):
         from_user: "types.User",
         invoice_payload: str,
         shipping_address: "types.ShippingAddress",
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class Sticker(Object):
     """This object represents a sticker.
@@ -66,7 +72,7 @@ class Sticker(Object):
         premium_animation: Optional["types.File"] = None,
         mask_position: Optional["types.MaskPosition"] = None,
         file_size: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
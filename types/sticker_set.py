@@ -1,9 +1,15 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class StickerSet(Object):
     """This object represents a sticker set.
@@ -41,7 +47,7 @@ class StickerSet(Object):
         contains_masks: bool,
         stickers: List["types.Sticker"],
         thumb: Optional["types.PhotoSize"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class SuccessfulPayment(Object):
     """This object contains basic information about a successful payment.
@@ -46,7 +52,7 @@ class SuccessfulPayment(Object):
         order_info: Optional["types.OrderInfo"] = None,
         telegram_payment_charge_id: str,
         provider_payment_charge_id: str,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
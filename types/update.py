@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Optional, Dict, Any
+
+    import pybotgram
+
 
 class Update(Object):
     """This object represents an incoming update.
@@ -101,7 +107,7 @@ class Update(Object):
         my_chat_member: Optional["types.ChatMemberUpdated"] = None,
         chat_member: Optional["types.ChatMemberUpdated"] = None,
         chat_join_request: Optional["types.ChatJoinRequest"] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -170,3 +176,86 @@ class Update(Object):
         )
 
         return cls(bot=bot, **data)
+
+    @classmethod
+    def _parser(
+        cls, allowed_updates: Optional[Iterable[str]] = None
+    ) -> Callable[[Dict[str, Any], "pybotgram.Bot"], Optional["Update"]]:
+        fields = {
+            "message": ("message", types.Message._parse),
+            "edited_message": ("edited_message", types.Message._parse),
+            "channel_post": ("channel_post", types.Message._parse),
+            "edited_channel_post": (
+                "edited_channel_post",
+                types.Message._parse,
+            ),
+            "inline_query": ("inline_query", types.InlineQuery._parse),
+            "chosen_inline_result": (
+                "chosen_inline_result",
+                types.ChosenInlineResult._parse,
+            ),
+            "callback_query": ("callback_query", types.CallbackQuery._parse),
+            "shipping_query": ("shipping_query", types.ShippingQuery._parse),
+            "pre_checkout_query": (
+                "pre_checkout_query",
+                types.PreCheckoutQuery._parse,
+            ),
+            "poll": ("poll", types.Poll._parse),
+            "poll_answer": ("poll_answer", types.PollAnswer._parse),
+            "my_chat_member": (
+                "my_chat_member",
+                types.ChatMemberUpdated._parse,
+            ),
+            "chat_member": ("chat_member", types.ChatMemberUpdated._parse),
+            "chat_join_request": (
+                "chat_join_request",
+                types.ChatJoinRequest._parse,
+            ),
+        }
+        # At most one kind is present, so only its branch is
+        # parsed and the kinds which are not allowed are ignored
+        kinds = {
+            "message",
+            "edited_message",
+            "channel_post",
+            "edited_channel_post",
+            "inline_query",
+            "chosen_inline_result",
+            "callback_query",
+            "shipping_query",
+            "pre_checkout_query",
+            "poll",
+            "poll_answer",
+            "my_chat_member",
+            "chat_member",
+            "chat_join_request",
+        }
+        ignored = set()
+
+        if allowed_updates is not None:
+            ignored = kinds - set(allowed_updates)
+
+        def parse(
+            data: Dict[str, Any], bot: "pybotgram.Bot"
+        ) -> Optional["Update"]:
+            if not (isinstance(data, dict) and data):
+                return None
+
+            kwargs = {}
+            for key, value in data.items():
+                if key in ignored:
+                    continue
+
+                field = fields.get(key)
+                if field is None:
+                    kwargs[key] = value
+                    continue
+
+                name, handler = field
+                if handler is not None:
+                    value = handler(value, bot)
+                kwargs[name] = value
+
+            return cls(bot=bot, **kwargs)
+
+        return parse
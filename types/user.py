@@ -1,8 +1,14 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class User(Object):
     """This object represents a Telegram user or bot.
@@ -64,7 +70,7 @@ class User(Object):
         can_join_groups: Optional[bool] = None,
         can_read_all_group_messages: Optional[bool] = None,
         supports_inline_queries: Optional[bool] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,9 +1,26 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
+
+def _parse_photo_size_list_list(
+    data: Any, bot: "pybotgram.Bot"
+) -> Optional[List[List["types.PhotoSize"]]]:
+    if not isinstance(data, list):
+        return None
+
+    # The element parser is looked up once, not once per element
+    parse = types.PhotoSize._parse
+    return [[parse(x0, bot) for x0 in x1] for x1 in data]
+
 
 class UserProfilePhotos(Object):
     """This object represent a user's profile pictures.
@@ -21,7 +38,7 @@ class UserProfilePhotos(Object):
         *,
         total_count: int,
         photos: List[List["types.PhotoSize"]],
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -37,6 +54,6 @@ class UserProfilePhotos(Object):
 
         data = data.copy()
 
-        data["photos"] = types.PhotoSize._parse_list(data.get("photos"), bot)
+        data["photos"] = _parse_photo_size_list_list(data.get("photos"), bot)
 
         return cls(bot=bot, **data)
@@ -1,9 +1,15 @@
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 from pybotgram import types
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any
+
+    import pybotgram
+
 
 class VideoNote(Object):
     """This object represents a video message (available in Telegram apps as
@@ -42,7 +48,7 @@ class VideoNote(Object):
         duration: int,
         thumb: Optional["types.PhotoSize"] = None,
         file_size: Optional[int] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
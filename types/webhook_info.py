@@ -1,8 +1,14 @@
-from typing import Optional, Dict, List, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-import pybotgram
 from .object import Object
 
+if TYPE_CHECKING:
+    from typing import Optional, Dict, List, Any
+
+    import pybotgram
+
 
 class WebhookInfo(Object):
     """Describes the current status of a webhook.
@@ -56,7 +62,7 @@ class WebhookInfo(Object):
         last_synchronization_error_date: Optional[int] = None,
         max_connections: Optional[int] = None,
         allowed_updates: Optional[List[str]] = None,
-        **_kwargs: Any
+        **_kwargs: Any,
     ):
         super().__init__()
 
@@ -1,142 +0,0 @@
-__all__ = (
-    "InputMedia",
-    "InputMediaPhoto",
-    "InputMediaVideo",
-    "InputMediaAnimation",
-    "InputMediaAudio",
-    "InputMediaDocument",
-    "InlineQueryResult",
-    "InlineQueryResultArticle",
-    "InlineQueryResultPhoto",
-    "InlineQueryResultGif",
-    "InlineQueryResultMpeg4Gif",
-    "InlineQueryResultVideo",
-    "InlineQueryResultAudio",
-    "InlineQueryResultVoice",
-    "InlineQueryResultDocument",
-    "InlineQueryResultLocation",
-    "InlineQueryResultVenue",
-    "InlineQueryResultContact",
-    "InlineQueryResultGame",
-    "InlineQueryResultCachedPhoto",
-    "InlineQueryResultCachedGif",
-    "InlineQueryResultCachedMpeg4Gif",
-    "InlineQueryResultCachedSticker",
-    "InlineQueryResultCachedDocument",
-    "InlineQueryResultCachedVideo",
-    "InlineQueryResultCachedVoice",
-    "InlineQueryResultCachedAudio",
-    "BotCommandScope",
-    "BotCommandScopeDefault",
-    "BotCommandScopeAllPrivateChats",
-    "BotCommandScopeAllGroupChats",
-    "BotCommandScopeAllChatAdministrators",
-    "BotCommandScopeChat",
-    "BotCommandScopeChatAdministrators",
-    "BotCommandScopeChatMember",
-    "ChatMember",
-    "ChatMemberOwner",
-    "ChatMemberAdministrator",
-    "ChatMemberMember",
-    "ChatMemberRestricted",
-    "ChatMemberLeft",
-    "ChatMemberBanned",
-    "PassportElementError",
-    "PassportElementErrorDataField",
-    "PassportElementErrorFrontSide",
-    "PassportElementErrorReverseSide",
-    "PassportElementErrorSelfie",
-    "PassportElementErrorFile",
-    "PassportElementErrorFiles",
-    "PassportElementErrorTranslationFile",
-    "PassportElementErrorTranslationFiles",
-    "PassportElementErrorUnspecified",
-    "MenuButton",
-    "MenuButtonCommands",
-    "MenuButtonWebApp",
-    "MenuButtonDefault",
-    "InputMessageContent",
-    "InputTextMessageContent",
-    "InputLocationMessageContent",
-    "InputVenueMessageContent",
-    "InputContactMessageContent",
-    "InputInvoiceMessageContent",
-)
-
-
-from input_media import (
-    InputMedia,
-    InputMediaPhoto,
-    InputMediaVideo,
-    InputMediaAnimation,
-    InputMediaAudio,
-    InputMediaDocument,
-)
-from inline_query_result import (
-    InlineQueryResult,
-    InlineQueryResultArticle,
-    InlineQueryResultPhoto,
-    InlineQueryResultGif,
-    InlineQueryResultMpeg4Gif,
-    InlineQueryResultVideo,
-    InlineQueryResultAudio,
-    InlineQueryResultVoice,
-    InlineQueryResultDocument,
-    InlineQueryResultLocation,
-    InlineQueryResultVenue,
-    InlineQueryResultContact,
-    InlineQueryResultGame,
-    InlineQueryResultCachedPhoto,
-    InlineQueryResultCachedGif,
-    InlineQueryResultCachedMpeg4Gif,
-    InlineQueryResultCachedSticker,
-    InlineQueryResultCachedDocument,
-    InlineQueryResultCachedVideo,
-    InlineQueryResultCachedVoice,
-    InlineQueryResultCachedAudio,
-)
-from bot_command_scope import (
-    BotCommandScope,
-    BotCommandScopeDefault,
-    BotCommandScopeAllPrivateChats,
-    BotCommandScopeAllGroupChats,
-    BotCommandScopeAllChatAdministrators,
-    BotCommandScopeChat,
-    BotCommandScopeChatAdministrators,
-    BotCommandScopeChatMember,
-)
-from chat_member import (
-    ChatMember,
-    ChatMemberOwner,
-    ChatMemberAdministrator,
-    ChatMemberMember,
-    ChatMemberRestricted,
-    ChatMemberLeft,
-    ChatMemberBanned,
-)
-from passport_element_error import (
-    PassportElementError,
-    PassportElementErrorDataField,
-    PassportElementErrorFrontSide,
-    PassportElementErrorReverseSide,
-    PassportElementErrorSelfie,
-    PassportElementErrorFile,
-    PassportElementErrorFiles,
-    PassportElementErrorTranslationFile,
-    PassportElementErrorTranslationFiles,
-    PassportElementErrorUnspecified,
-)
-from menu_button import (
-    MenuButton,
-    MenuButtonCommands,
-    MenuButtonWebApp,
-    MenuButtonDefault,
-)
-from input_message_content import (
-    InputMessageContent,
-    InputTextMessageContent,
-    InputLocationMessageContent,
-    InputVenueMessageContent,
-    InputContactMessageContent,
-    InputInvoiceMessageContent,
-)